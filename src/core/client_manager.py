@@ -1,28 +1,48 @@
 import threading
+import time
 from tkinter import messagebox
 
 from src.core.game_process import is_game_running
-from src.core.offset_fetcher import smart_reinstall_dumper
 from src.utils.logger import Logger
 from src.utils.config_manager import ConfigManager
 
 logger = Logger.get_logger(__name__)
 
+# How often a stopping feature thread is polled, and how long before giving up on it.
+_THREAD_POLL_MS = 100
+_THREAD_JOIN_TIMEOUT = 2.0
+
 class ClientManager:
     def __init__(self, main_window) -> None:
         self.main_window = main_window
         self.memory_manager = main_window.memory_manager
         self.features = main_window.features
+        # Stopped feature threads still being watched by _watch_exit. The memory
+        # handle is only reset once they are gone, since they may still read it.
+        self._exiting: set = set()
+        self._reset_pending = False
 
-    def _start_feature(self, feature_name: str, feature_obj, config: dict) -> bool:
+    def _start_feature(self, feature_data: dict, config: dict) -> bool:
+        feature_name, feature_obj = feature_data["name"], feature_data["instance"]
         if getattr(feature_obj, "is_running", False):
             return False
+        previous = feature_data["thread"]
+        if previous is not None and previous.is_alive():
+            # A quick off/on toggle: wait for the old loop to exit instead of
+            # running two loops against the same stop_event.
+            # A thread that outlives the stop timeout is treated as hung.
+            deadline = time.monotonic() + _THREAD_JOIN_TIMEOUT
+            feature_data["pending_start"] = self.main_window.root.after(
+                _THREAD_POLL_MS, self._retry_start, feature_data, deadline,
+            )
+            logger.debug("%s still shutting down; start deferred.", feature_name)
+            return True
         try:
             feature_obj.update_config(config)
             feature_obj.is_running = True
             thread = threading.Thread(target=feature_obj.start, daemon=True)
             thread.start()
-            setattr(self.main_window, f"{feature_name.lower()}_thread", thread)
+            feature_data["thread"] = thread
             logger.info("%s started.", feature_name)
             return True
         except Exception:
@@ -34,19 +54,42 @@ class ClientManager:
             )
             return False
 
-    def _stop_feature(self, feature_name: str, feature_obj) -> bool:
+    def _retry_start(self, feature_data: dict, deadline: float) -> None:
+        feature_data["pending_start"] = None
+        if feature_data["thread"].is_alive():
+            if time.monotonic() < deadline:
+                feature_data["pending_start"] = self.main_window.root.after(
+                    _THREAD_POLL_MS, self._retry_start, feature_data, deadline,
+                )
+            else:
+                logger.warning("%s thread never exited; start abandoned.", feature_data["name"])
+            return
+        # Settings may have changed while waiting; start on what is current now.
+        self._start_feature(feature_data, ConfigManager.load_config())
+
+    def _stop_feature(self, feature_data: dict, wait: bool = False) -> bool:
+        """Signal a feature to stop.
+
+        By default the thread is not joined on the Tk thread; _watch_exit polls
+        it with root.after instead. With wait=True (shutdown) nothing is polled
+        and stop_client joins every signalled thread afterwards.
+        """
+        feature_name, feature_obj = feature_data["name"], feature_data["instance"]
+        pending = feature_data.get("pending_start")
+        if pending is not None:
+            self.main_window.root.after_cancel(pending)
+            feature_data["pending_start"] = None
         if not (feature_obj and getattr(feature_obj, "is_running", False)):
             return False
         try:
             feature_obj.stop()
-            thread = getattr(self.main_window, f"{feature_name.lower()}_thread", None)
-            if thread and thread.is_alive():
-                thread.join(timeout=2.0)
-                if thread.is_alive():
-                    logger.warning("%s thread did not terminate cleanly.", feature_name)
-                else:
-                    logger.info("%s thread terminated.", feature_name)
-            setattr(self.main_window, f"{feature_name.lower()}_thread", None)
+            thread = feature_data["thread"]
+            if thread and thread.is_alive() and not wait:
+                self._exiting.add(thread)
+                deadline = time.monotonic() + _THREAD_JOIN_TIMEOUT
+                self.main_window.root.after(
+                    _THREAD_POLL_MS, self._watch_exit, feature_data, thread, deadline,
+                )
             feature_obj.is_running = False
             logger.debug("%s stopped.", feature_name)
             return True
@@ -55,6 +98,29 @@ class ClientManager:
             feature_obj.is_running = False
             return False
 
+    def _watch_exit(self, feature_data: dict, thread: threading.Thread, deadline: float) -> None:
+        if thread.is_alive() and time.monotonic() < deadline:
+            self.main_window.root.after(
+                _THREAD_POLL_MS, self._watch_exit, feature_data, thread, deadline,
+            )
+            return
+        self._exiting.discard(thread)
+        self._log_exit(feature_data["name"], thread)
+        # Past the deadline a hung thread is given up on, as stop_client(wait=True) does.
+        if self._reset_pending and not self._exiting:
+            self._reset_memory()
+
+    def _reset_memory(self) -> None:
+        self._reset_pending = False
+        self.memory_manager.reset()
+
+    @staticmethod
+    def _log_exit(feature_name: str, thread: threading.Thread) -> None:
+        if thread.is_alive():
+            logger.warning("%s thread did not terminate cleanly.", feature_name)
+        else:
+            logger.info("%s thread terminated.", feature_name)
+
     def start_client(self) -> None:
         # cs2-dumper needs CS2 running before it can dump -- check upfront so
         # the user sees a clear error rather than a cryptic subprocess failure.
@@ -65,9 +131,6 @@ class ClientManager:
             )
             return
 
-        # Check if we need to purge the dumper due to a CS2 update
-        smart_reinstall_dumper()
-
         if not self.main_window.offsets:
             if self.main_window._offsets_fetching:
                 self.main_window.update_client_status("Dumping offsets…", "#f59e0b")
@@ -76,6 +139,10 @@ class ClientManager:
             self.main_window.fetch_offsets_async(on_success=self.start_client)
             return
 
+        # Started again before the last stop's threads exited: keep the current
+        # handle rather than resetting it under the new features.
+        self._reset_pending = False
+
         if not self.memory_manager.is_initialized:
             if not self.memory_manager.initialize():
                 self.main_window.update_client_status("Inactive", "#ef4444")
@@ -96,7 +163,7 @@ class ClientManager:
             if getattr(obj, "is_running", False):
                 logger.info("%s is already running.", name)
                 any_started = True
-            elif self._start_feature(name, obj, config):
+            elif self._start_feature(feature_data, config):
                 any_started = True
 
         if any_started:
@@ -109,14 +176,27 @@ class ClientManager:
                 "Enable at least one feature in General Settings.",
             )
 
-    def stop_client(self) -> None:
-        stopped_any = False
-        for feature_data in self.features.values():
-            if self._stop_feature(feature_data["name"], feature_data["instance"]):
-                stopped_any = True
+    def stop_client(self, wait: bool = False) -> None:
+        stopped = [fd for fd in self.features.values() if self._stop_feature(fd, wait=wait)]
+        stopped_any = bool(stopped)
+
+        if wait:
+            # Every loop was signalled above and winds down in parallel, so one
+            # shared deadline bounds the join instead of a timeout per feature.
+            deadline = time.monotonic() + _THREAD_JOIN_TIMEOUT
+            for feature_data in stopped:
+                thread = feature_data["thread"]
+                if thread is not None:
+                    thread.join(timeout=max(0.0, deadline - time.monotonic()))
+                    self._log_exit(feature_data["name"], thread)
 
         # Reset the memory handle so the next start_client gets a fresh attach.
-        self.memory_manager.reset()
+        # Without wait, threads still winding down may be reading through it, so
+        # _watch_exit does the reset once the last of them has exited.
+        if wait or not self._exiting:
+            self._reset_memory()
+        else:
+            self._reset_pending = True
 
         # Always clear the offset cache on Stop so the next Start re-dumps
         # from live memory -- guarantees fresh offsets after a CS2 update.
@@ -133,12 +213,14 @@ class ClientManager:
         else:
             logger.debug("No features were running.")
 
-    def apply_feature_state_changes(self, old_config: dict, new_config: dict) -> None:
+    def apply_feature_state_changes(self, old_config: dict, new_config: dict) -> set:
         """Apply feature toggles from the General Settings tab.
 
         Stops running features if toggled off.
         Starts new features if toggled on AND the client is currently active.
+        Returns the keys of the features started here, which already run on new_config.
         """
+        started = set()
         for key, feature_data in self.features.items():
             old_on  = old_config["General"].get(key, False)
             new_on  = new_config["General"].get(key, False)
@@ -146,24 +228,33 @@ class ClientManager:
             if old_on == new_on:
                 continue
             if not new_on and running:
-                self._stop_feature(feature_data["name"], feature_data["instance"])
+                self._stop_feature(feature_data)
             elif new_on and not running:
-                if self.memory_manager.is_initialized:
-                    self._start_feature(feature_data["name"], feature_data["instance"], new_config)
+                if self.memory_manager.is_initialized and self._start_feature(feature_data, new_config):
+                    started.add(key)
+        return started
 
-    def update_running_feature_configs(self, new_config: dict) -> None:
+    def update_running_feature_configs(self, new_config: dict, sections=None, skip=()) -> None:
         """Push a fresh config to every running feature and refresh the status indicator.
 
         Skips non-running features: they will pick up the latest config when
         next started, and calling update_config on them triggers load_configuration()
         which has the side effect of clearing stop_event.
+
+        If sections is given, only features whose own config section is in it
+        are updated; the rest keep their current (equal) settings. Features in
+        skip (just started on new_config) are not updated a second time.
         """
         any_running = False
-        for feature_data in self.features.values():
+        for key, feature_data in self.features.items():
             instance = feature_data["instance"]
             if getattr(instance, "is_running", False):
+                any_running = True
+                if key in skip:
+                    continue
+                if sections is not None and feature_data["section"] not in sections:
+                    continue
                 instance.update_config(new_config)
                 logger.debug("Config updated for %s.", feature_data["name"])
-                any_running = True
         status, color = ("Active", "#22c55e") if any_running else ("Inactive", "#ef4444")
         self.main_window.update_client_status(status, color)
\ No newline at end of file
@@ -10,10 +10,14 @@ logger = Logger.get_logger(__name__)
 _CS2_PROCESS = "cs2.exe"
 _CS2_WINDOW_TITLE = "Counter-Strike 2"
 _GAME_ACTIVE_TTL = 0.2  # seconds between window-focus polls
+_GAME_RUNNING_TTL = 1.0  # seconds between process-list scans
 
 _cache_active: bool = False
 _cache_last_check: float = 0.0
 
+_cache_running: bool = False
+_cache_running_check: float = 0.0
+
 def is_game_active() -> bool:
     """
     Return True if the CS2 window currently has focus.
@@ -34,8 +38,22 @@ def is_game_active() -> bool:
     return result
 
 def is_game_running() -> bool:
-    """Return True if cs2.exe is present in the process list."""
-    return any(
+    """
+    Return True if cs2.exe is present in the process list.
+
+    Result is cached for _GAME_RUNNING_TTL seconds; start_client and the
+    offset fetch both check within the same Start click.
+    """
+    global _cache_running, _cache_running_check
+
+    now = time.monotonic()
+    if now - _cache_running_check < _GAME_RUNNING_TTL:
+        return _cache_running
+
+    result = any(
         proc.info["name"] == _CS2_PROCESS
         for proc in psutil.process_iter(attrs=["name"])
-    )
\ No newline at end of file
+    )
+    _cache_running = result
+    _cache_running_check = now
+    return result
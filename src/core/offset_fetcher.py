@@ -3,6 +3,7 @@ import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from typing import NamedTuple
 
 import orjson
 import requests
@@ -27,6 +28,14 @@ _CS2_DUMPER_EXE_PATH = Path(ConfigManager.CONFIG_DIRECTORY) / _CS2_DUMPER_EXE_NA
 # Subprocess timeout in seconds -- cs2-dumper typically finishes in <10s.
 _SUBPROCESS_TIMEOUT = 120
 
+class _OutputFiles(NamedTuple):
+    offsets: Path
+    client: Path
+    buttons: Path
+
+# File names cs2-dumper writes for each field of _OutputFiles, built once at import.
+_OUTPUT_FILES = ("offsets.json", "client_dll.json", "buttons.json")
+
 # Public API
 def fetch_offsets() -> tuple[dict | None, dict | None, dict | None]:
     """Run cs2-dumper against the live CS2 process and return parsed offsets.
@@ -49,17 +58,83 @@ def fetch_offsets() -> tuple[dict | None, dict | None, dict | None]:
 
         return _load_output(tmp)
 
+def fetch_release_json(repo: str, timeout: float = 10) -> dict:
+    """GET the latest-release JSON for repo, revalidating a local copy with ETag.
+
+    The last 200 response is cached in the config directory together with its
+    ETag / Last-Modified headers. Subsequent calls send them back as
+    If-None-Match / If-Modified-Since; on 304 the cached body is returned without
+    re-downloading or re-parsing the payload (and without spending GitHub API
+    rate limit). Network and HTTP errors propagate to the caller unchanged.
+    """
+    cache_path = _release_cache_path(repo)
+    cached = _read_release_cache(cache_path)
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    resp = requests.get(_GITHUB_RELEASES_URL.format(repo=repo), timeout=timeout, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        logger.debug("Release metadata for %s not modified; using cached copy.", repo)
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return cached["data"]
+
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    _write_release_cache(cache_path, {
+        "etag":          resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "data":          data,
+    })
+    return data
+
+def _release_cache_path(repo: str) -> Path:
+    slug = repo.replace("/", "_").lower()
+    return Path(ConfigManager.CACHE_DIRECTORY) / f"release_cache_{slug}.json"
+
+def _read_release_cache(path: Path) -> "dict | None":
+    try:
+        cached = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or not isinstance(cached.get("data"), dict):
+        return None
+    return cached
+
+def _write_release_cache(path: Path, payload: dict) -> None:
+    """Write payload next to path and swap it in so readers never see a partial file.
+
+    Each writer gets its own temp file: two fetches of the same repo (dashboard
+    version check and dumper download) can refresh the cache concurrently.
+    """
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.stem, suffix=".tmp", delete=False,
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(orjson.dumps(payload))
+        os.replace(tmp_name, path)
+    except OSError as exc:
+        logger.debug("Could not write release cache %s: %s", path, exc)
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
 def fetch_latest_release(repo: str) -> "dict | None":
     """Fetch the latest VioletWing release metadata from the GitHub Releases API."""
-    url = _GITHUB_RELEASES_URL.format(repo=repo)
     try:
-        resp = requests.get(
-            url,
-            timeout=10,
-            headers={"Accept": "application/vnd.github+json"},
-        )
-        resp.raise_for_status()
-        data: dict = orjson.loads(resp.content)
+        data: dict = fetch_release_json(repo, timeout=10)
 
         tag = data.get("tag_name")
         if not tag:
@@ -146,13 +221,7 @@ def _download_cs2_dumper() -> bool:
     api_url = _GITHUB_RELEASES_URL.format(repo=_CS2_DUMPER_REPO)
     try:
         logger.info("Fetching cs2-dumper release info from %s", api_url)
-        resp = requests.get(
-            api_url,
-            timeout=15,
-            headers={"Accept": "application/vnd.github+json"},
-        )
-        resp.raise_for_status()
-        data = orjson.loads(resp.content)
+        data = fetch_release_json(_CS2_DUMPER_REPO, timeout=15)
 
         download_url: str | None = None
         for asset in data.get("assets", []):
@@ -265,19 +334,17 @@ def _load_output(output_dir: str) -> tuple[dict, dict, dict] | tuple[None, None,
     We wrap it here at the load boundary so the rest of the codebase is unaffected.
     """
     tmp = Path(output_dir)
-    offsets_file = tmp / "offsets.json"
-    client_file  = tmp / "client_dll.json"
-    buttons_file = tmp / "buttons.json"
+    paths = _OutputFiles(*(tmp / name for name in _OUTPUT_FILES))
 
-    missing = [f.name for f in [offsets_file, client_file, buttons_file] if not f.exists()]
+    missing = [f.name for f in paths if not f.exists()]
     if missing:
         Logger.error_code(EC.E4015, "Missing output files: %s", ", ".join(missing))
         return None, None, None
 
     try:
-        offsets     = orjson.loads(offsets_file.read_bytes())
-        client      = orjson.loads(client_file.read_bytes())
-        buttons_raw = orjson.loads(buttons_file.read_bytes())
+        offsets     = orjson.loads(paths.offsets.read_bytes())
+        client      = orjson.loads(paths.client.read_bytes())
+        buttons_raw = orjson.loads(paths.buttons.read_bytes())
     except (orjson.JSONDecodeError, IOError) as exc:
         Logger.error_code(EC.E4015, "JSON read error: %s", exc)
         return None, None, None
@@ -6,7 +6,7 @@ import pyMeow as overlay
 from pynput.keyboard import Listener as KeyboardListener
 
 from src.features.base_feature import BaseFeature
-from src.utils.config_manager import ConfigManager, Colors, COLOR_CHOICES
+from src.utils.config_manager import ConfigManager, Colors
 from src.core.game_process import is_game_active
 from src.utils.logger import Logger
 import src.utils.error_codes as EC
@@ -416,7 +416,6 @@ class CS2Overlay(BaseFeature):
     def stop(self) -> None:
         self.is_running = False
         self.stop_event.set()
-        time.sleep(0.1)
         logger.debug("Overlay stopped.")
 
     def _resolve_colors(self) -> None:
@@ -82,7 +82,8 @@ class CS2NoFlash(BaseFeature):
                             local_player_addr = self.local_player_address
                             flash_offset = self.flash_duration_offset
                         failed_reads = 0
-                        sleep(reinit_backoff)
+                        if self.stop_event.wait(reinit_backoff):
+                            break
                         reinit_backoff = min(reinit_backoff * 2, max_reinit_backoff)
                         continue
 
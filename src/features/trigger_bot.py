@@ -139,7 +139,6 @@ class CS2TriggerBot(BaseFeature):
     def stop(self) -> None:
         self.is_running = False
         self.stop_event.set()
-        time.sleep(0.1)
 
         if self._mouse_listener is not None:
             try:
@@ -190,12 +189,11 @@ class CS2TriggerBot(BaseFeature):
 
     def _weapon_settings(self, weapon_type: str) -> Dict[str, Any]:
         if weapon_type != self.last_weapon_type:
-            self.current_weapon_settings = dict(
-                self.weapon_settings_cache.get(
-                    weapon_type,
-                    self.weapon_settings_cache.get("Rifles", {}),
-                )
-            )
+            # Only fall back to Rifles on a miss; a .get() default would look it up every time.
+            settings = self.weapon_settings_cache.get(weapon_type)
+            if settings is None:
+                settings = self.weapon_settings_cache.get("Rifles", {})
+            self.current_weapon_settings = dict(settings)
             self.last_weapon_type = weapon_type
         return self.current_weapon_settings
 
@@ -50,6 +50,6 @@ def create_bunnyhop_config_section(main_window, parent):
     # Jump Key
     initial_key = main_window.bunnyhop.config.get("Bunnyhop", {}).get("JumpKey", "space")
     key_var = ctk.StringVar(value=initial_key)
-    recorder = KeybindRecorder(wf, var=key_var, on_capture=main_window.save_settings)
+    recorder = KeybindRecorder(wf, var=key_var, on_capture=main_window.schedule_save)
     recorder.pack(side="left", padx=(0, 20))
     main_window.ui_bridge.register("JumpKey", var=key_var)
\ No newline at end of file
@@ -7,8 +7,7 @@ import customtkinter as ctk
 
 from src.utils.logger import Logger
 import src.utils.error_codes as EC
-from src.utils.utility import Utility
-from src.gui.icon_loader import ASSETS_DIR
+from src.gui.icon_loader import set_window_icon
 from src.gui.theme import (
     FONT_FAMILY_BOLD,
     FONT_FAMILY_REGULAR,
@@ -111,8 +110,7 @@ class ChangelogWindow(ctk.CTkToplevel):
 
     def _set_icon(self) -> None:
         try:
-            path = Utility.resource_path(f"{ASSETS_DIR}/icon.ico")
-            self.after(200, lambda: self.iconbitmap(path))
+            self.after(200, lambda: set_window_icon(self))
         except Exception as exc:
             Logger.error_code(EC.E0001, "changelog icon: %s", exc)
 
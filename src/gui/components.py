@@ -1,3 +1,4 @@
+import re
 import customtkinter as ctk
 from src.gui.icon_loader import icon_label
 from src.gui.theme import (
@@ -7,6 +8,20 @@ from src.gui.theme import (
     SECTION_STYLE, SETTING_ITEM_STYLE,
 )
 
+# Partial input accepted while typing: "", "0", "0.", ".5" for decimals; digits only for integers.
+_DECIMAL_RE = re.compile(r"\d*\.?\d*")
+_INTEGER_RE = re.compile(r"\d*")
+
+def numeric_entry_kwargs(parent, integer=False) -> dict:
+    """Return CTkEntry kwargs that make Tk reject non-numeric keystrokes.
+
+    The check runs inside the widget, so a typo never reaches the entry's text and
+    save-time validation only has to deal with ranges and empty fields.
+    """
+    pattern = _INTEGER_RE if integer else _DECIMAL_RE
+    vcmd = parent.register(lambda proposed: pattern.fullmatch(proposed) is not None)
+    return {"validate": "key", "validatecommand": (vcmd, "%P")}
+
 def create_scrollable_frame(parent, main_window=None) -> ctk.CTkScrollableFrame:
     """Create and configure a standard CTkScrollableFrame with focus-recovery scroll bindings.
     
@@ -95,35 +110,25 @@ def build_item_scaffold(parent, label_text, description, is_last=False) -> ctk.C
     Bottom padding is 40 px for the last item in a section, 30 px otherwise -
     matching the visual rhythm used across all settings tabs.
 
+    The card is one styled frame gridded into a label column and a widget
+    column, rather than a stack of nested pack frames.
+
     Returns the right-side widget frame for the caller to populate.
     """
-    item_frame = ctk.CTkFrame(parent, fg_color="transparent")
-    item_frame.pack(fill="x", padx=40, pady=(0, 40 if is_last else 30))
-
-    container = ctk.CTkFrame(item_frame, **SETTING_ITEM_STYLE)
-    container.pack(fill="x")
+    container = ctk.CTkFrame(parent, **SETTING_ITEM_STYLE)
+    container.pack(fill="x", padx=40, pady=(0, 40 if is_last else 30))
+    container.grid_columnconfigure(0, weight=1)
 
-    content = ctk.CTkFrame(container, fg_color="transparent")
-    content.pack(fill="x", padx=25, pady=25)
-
-    lf = ctk.CTkFrame(content, fg_color="transparent")
-    lf.pack(side="left", fill="x", expand=True)
-    
+    ctk.CTkLabel(
+        container, text=label_text, font=FONT_ITEM_LABEL,
+        text_color=COLOR_TEXT_PRIMARY, anchor="w",
+    ).grid(row=0, column=0, sticky="ew", padx=(25, 0), pady=(25, 4) if description else 25)
     if description:
         ctk.CTkLabel(
-            lf, text=label_text, font=FONT_ITEM_LABEL,
-            text_color=COLOR_TEXT_PRIMARY, anchor="w",
-        ).pack(fill="x", pady=(0, 4))
-        ctk.CTkLabel(
-            lf, text=description, font=FONT_ITEM_DESCRIPTION,
+            container, text=description, font=FONT_ITEM_DESCRIPTION,
             text_color=COLOR_TEXT_SECONDARY, anchor="w", wraplength=400,
-        ).pack(fill="x")
-    else:
-        ctk.CTkLabel(
-            lf, text=label_text, font=FONT_ITEM_LABEL,
-            text_color=COLOR_TEXT_PRIMARY, anchor="w",
-        ).pack(fill="x")
+        ).grid(row=1, column=0, sticky="ew", padx=(25, 0), pady=(0, 25))
 
-    wf = ctk.CTkFrame(content, fg_color="transparent")
-    wf.pack(side="right", padx=(30, 0))
-    return wf
\ No newline at end of file
+    wf = ctk.CTkFrame(container, fg_color="transparent")
+    wf.grid(row=0, column=1, rowspan=2 if description else 1, sticky="e", padx=(30, 25), pady=25)
+    return wf
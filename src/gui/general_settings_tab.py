@@ -12,6 +12,9 @@ from src.gui.theme import (
     BUTTON_STYLE_PRIMARY, BUTTON_STYLE_DANGER,
 )
 
+# Profile dropdown sets its own width, so the shared style is filtered once here.
+_PROFILE_DROPDOWN_STYLE = {k: v for k, v in COMBOBOX_STYLE.items() if k != "width"}
+
 def populate_general_settings(main_window, frame):
     settings = create_scrollable_frame(frame, main_window)
 
@@ -35,11 +38,12 @@ def _create_features_section(main_window, parent):
                           icon_file="sliders_icon.png")
     
     wf = build_item_scaffold(section, "Enable Features", "", is_last=True)
-    
-    _create_checkbox_item(wf, "Trigger", "Trigger", main_window)
-    _create_checkbox_item(wf, "Overlay", "Overlay", main_window)
-    _create_checkbox_item(wf, "Bunnyhop", "Bunnyhop", main_window)
-    _create_checkbox_item(wf, "Noflash", "Noflash", main_window)
+    general = main_window.triggerbot.config["General"]
+
+    _create_checkbox_item(wf, "Trigger", "Trigger", main_window, general)
+    _create_checkbox_item(wf, "Overlay", "Overlay", main_window, general)
+    _create_checkbox_item(wf, "Bunnyhop", "Bunnyhop", main_window, general)
+    _create_checkbox_item(wf, "Noflash", "Noflash", main_window, general)
 
 def _create_program_section(main_window, parent):
     section = create_section_frame(parent)
@@ -48,8 +52,9 @@ def _create_program_section(main_window, parent):
                           icon_file="user_secret_icon.png")
     
     wf_prog = build_item_scaffold(section, "Program Behaviour", "", is_last=False)
-    _create_checkbox_item(wf_prog, "Detailed Logs", "DetailedLogs", main_window)
-    _create_checkbox_item(wf_prog, "Disguise", "Disguise", main_window)
+    general = main_window.triggerbot.config["General"]
+    _create_checkbox_item(wf_prog, "Detailed Logs", "DetailedLogs", main_window, general)
+    _create_checkbox_item(wf_prog, "Disguise", "Disguise", main_window, general)
 
     wf = build_item_scaffold(section, "Active Profile",
                              "The program this instance is currently disguised as.",
@@ -131,7 +136,7 @@ def _create_profile_row(main_window, parent):
     
     dropdown = ctk.CTkOptionMenu(
         row1, variable=profile_var, values=display, width=160,
-        **{k: v for k, v in COMBOBOX_STYLE.items() if k != "width"},
+        **_PROFILE_DROPDOWN_STYLE,
     )
     dropdown.pack(side="left", padx=(0, 10))
     main_window._profile_var = profile_var
@@ -223,10 +228,10 @@ def _delete_selected_profile(main_window) -> None:
         AppModal.error(main_window.root, "Delete Failed",
                        f"Could not delete profile '{name}'. Check logs.")
 
-def _create_checkbox_item(parent, label_text, key, main_window):
-    var = ctk.BooleanVar(value=main_window.triggerbot.config["General"].get(key, False))
+def _create_checkbox_item(parent, label_text, key, main_window, general):
+    var = ctk.BooleanVar(value=general.get(key, False))
     cb = ctk.CTkCheckBox(parent, text=label_text, variable=var,
-                         command=lambda: main_window.save_settings(show_message=False),
+                         command=main_window.schedule_save,
                          **CHECKBOX_STYLE)
     cb.pack(side="left", padx=(0, 20))
     main_window.ui_bridge.register(key, var=var)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import customtkinter as ctk
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import orjson
 import requests
 from datetime import datetime
@@ -8,6 +9,7 @@ from src.gui.icon_loader import icon_label, load_icon
 from src.utils.logger import Logger
 from src.utils.config_manager import ConfigManager
 from src.core.process_monitor import ProcessMonitor
+from src.core.offset_fetcher import fetch_release_json
 from src.gui.components import create_scrollable_frame
 from src.gui.theme import (
     COLOR_BACKGROUND,
@@ -96,8 +98,10 @@ def populate_dashboard(main_window, frame):
         val_frame = ctk.CTkFrame(row, fg_color="transparent")
         val_frame.pack(side="left")
         # placeholder uses FONT_TABULAR so the column width is stable before first poll
-        ctk.CTkLabel(val_frame, text="Loading...", font=FONT_TABULAR,
-                     text_color=COLOR_TEXT_SECONDARY).pack(side="left")
+        placeholder = ctk.CTkLabel(val_frame, text="Loading...", font=FONT_TABULAR,
+                                   text_color=COLOR_TEXT_SECONDARY)
+        placeholder.pack(side="left")
+        val_frame._chip_labels = [placeholder]
         return val_frame
 
     main_window._sysmon_cs2_frame  = _sysmon_row(monitor, "crosshairs_icon.png", "CS2")
@@ -121,17 +125,22 @@ def start_process_monitor_poll(main_window) -> None:
                 frame = getattr(main_window, frame_attr, None)
                 if not frame or not frame.winfo_exists():
                     return
-                for child in frame.winfo_children():
-                    child.destroy()
-                for chip in chips:
+                # Keep the labels from the last poll and reconfigure them in place;
+                # only a change in chip layout (e.g. CS2 starting) rebuilds the row.
+                labels = getattr(frame, "_chip_labels", [])
+                if len(labels) != len(chips):
+                    for label in labels:
+                        label.destroy()
+                    labels = frame._chip_labels = [
+                        ctk.CTkLabel(frame, text="", anchor="w") for _ in chips
+                    ]
+                    for label in labels:
+                        label.pack(side="left")
+                for label, chip in zip(labels, chips):
                     text, color = chip[0], chip[1]
                     # optional third element overrides font for numeric labels (tabular-nums)
                     font = chip[2] if len(chip) > 2 else FONT_ITEM_DESCRIPTION
-                    ctk.CTkLabel(
-                        frame, text=text,
-                        font=font,
-                        text_color=color, anchor="w",
-                    ).pack(side="left")
+                    label.configure(text=text, font=font, text_color=color)
             except Exception:
                 pass
         main_window.ui_queue_put(_apply)
@@ -139,54 +148,70 @@ def start_process_monitor_poll(main_window) -> None:
     def _dot():
         return (f"  {_DOT}  ", COLOR_TEXT_SECONDARY)
 
+    def _collect() -> None:
+        cs2 = ProcessMonitor.get_cs2_stats()
+        if cs2:
+            _set_chips("_sysmon_cs2_frame", [
+                (f"PID {cs2['pid']}",          COLOR_TEXT_SECONDARY),
+                _dot(),
+                (f"{cs2['mem_mb']:.0f}",        COLOR_TEXT_PRIMARY,    FONT_TABULAR),
+                (" MB",                          COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
+                _dot(),
+                (f"{cs2['cpu_percent']:.1f}%",  COLOR_TEXT_PRIMARY,    FONT_TABULAR),
+                (" CPU",                         COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
+            ])
+        else:
+            _set_chips("_sysmon_cs2_frame", [("Not running", _RAM_COLOR_RED)])
+
+        slf = ProcessMonitor.get_self_stats()
+        if slf:
+            _set_chips("_sysmon_self_frame", [
+                (f"{slf['mem_mb']:.0f}",         COLOR_TEXT_PRIMARY,    FONT_TABULAR),
+                (" MB",                           COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
+                _dot(),
+                (f"{slf['cpu_percent']:.1f}%",   COLOR_TEXT_PRIMARY,    FONT_TABULAR),
+                (" CPU",                          COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
+            ])
+        else:
+            _set_chips("_sysmon_self_frame", [("-", COLOR_TEXT_SECONDARY)])
+
+        ram = ProcessMonitor.get_system_ram()
+        if ram:
+            pct = ram["percent"]
+            pct_color = (
+                _RAM_COLOR_RED   if pct >= 85 else
+                _RAM_COLOR_AMBER if pct >= 70 else
+                _RAM_COLOR_OK
+            )
+            _set_chips("_sysmon_ram_frame", [
+                (f"{ram['used_gb']:.1f}",         COLOR_TEXT_PRIMARY,   FONT_TABULAR),
+                (f" / {ram['total_gb']:.1f} GB",  COLOR_TEXT_SECONDARY, FONT_ITEM_DESCRIPTION),
+                _dot(),
+                (f"{pct:.0f}%",                   pct_color,            FONT_TABULAR),
+            ])
+        else:
+            _set_chips("_sysmon_ram_frame", [("-", COLOR_TEXT_SECONDARY)])
+
     def _poll() -> None:
-        if getattr(main_window, "current_view", None) == "dashboard":
-            cs2 = ProcessMonitor.get_cs2_stats()
-            if cs2:
-                _set_chips("_sysmon_cs2_frame", [
-                    (f"PID {cs2['pid']}",          COLOR_TEXT_SECONDARY),
-                    _dot(),
-                    (f"{cs2['mem_mb']:.0f}",        COLOR_TEXT_PRIMARY,    FONT_TABULAR),
-                    (" MB",                          COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
-                    _dot(),
-                    (f"{cs2['cpu_percent']:.1f}%",  COLOR_TEXT_PRIMARY,    FONT_TABULAR),
-                    (" CPU",                         COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
-                ])
-            else:
-                _set_chips("_sysmon_cs2_frame", [("Not running", _RAM_COLOR_RED)])
-
-            slf = ProcessMonitor.get_self_stats()
-            if slf:
-                _set_chips("_sysmon_self_frame", [
-                    (f"{slf['mem_mb']:.0f}",         COLOR_TEXT_PRIMARY,    FONT_TABULAR),
-                    (" MB",                           COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
-                    _dot(),
-                    (f"{slf['cpu_percent']:.1f}%",   COLOR_TEXT_PRIMARY,    FONT_TABULAR),
-                    (" CPU",                          COLOR_TEXT_SECONDARY,  FONT_ITEM_DESCRIPTION),
-                ])
-            else:
-                _set_chips("_sysmon_self_frame", [("-", COLOR_TEXT_SECONDARY)])
-
-            ram = ProcessMonitor.get_system_ram()
-            if ram:
-                pct = ram["percent"]
-                pct_color = (
-                    _RAM_COLOR_RED   if pct >= 85 else
-                    _RAM_COLOR_AMBER if pct >= 70 else
-                    _RAM_COLOR_OK
-                )
-                _set_chips("_sysmon_ram_frame", [
-                    (f"{ram['used_gb']:.1f}",         COLOR_TEXT_PRIMARY,   FONT_TABULAR),
-                    (f" / {ram['total_gb']:.1f} GB",  COLOR_TEXT_SECONDARY, FONT_ITEM_DESCRIPTION),
-                    _dot(),
-                    (f"{pct:.0f}%",                   pct_color,            FONT_TABULAR),
-                ])
-            else:
-                _set_chips("_sysmon_ram_frame", [("-", COLOR_TEXT_SECONDARY)])
+        nonlocal pending
+        # Nothing to look at while minimized or hidden to the tray; skip the scan.
+        if (
+            getattr(main_window, "current_view", None) == "dashboard"
+            and main_window.root.state() not in ("iconic", "withdrawn")
+        ):
+            # psutil's process scan can take tens of ms; keep it off the Tk thread.
+            # _set_chips already marshals the rendering back through ui_queue.
+            # One reused worker, and a slow scan is never stacked with the next.
+            if pending is None or pending.done():
+                pending = executor.submit(_collect)
 
         if main_window.root.winfo_exists():
             main_window._process_monitor_timer = main_window.root.after(5000, _poll)
 
+    executor = main_window._sysmon_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="sysmon",
+    )
+    pending = None
     main_window._process_monitor_timer = main_window.root.after(5000, _poll)
 
 
@@ -236,13 +261,7 @@ def fetch_cs2_dumper_version(main_window) -> None:
         if stop_event.is_set():
             return
         try:
-            resp = requests.get(
-                f"https://api.github.com/repos/{_CS2_DUMPER_REPO}/releases/latest",
-                timeout=10,
-                headers={"Accept": "application/vnd.github+json"},
-            )
-            resp.raise_for_status()
-            data = orjson.loads(resp.content)
+            data = fetch_release_json(_CS2_DUMPER_REPO, timeout=10)
             tag = data.get("tag_name", "unknown")
             _update_ui(tag, _COLOR_OK)
         except Exception as exc:
@@ -302,12 +321,8 @@ def fetch_cs2_latest_patch(main_window) -> None:
                 return
             except Exception as exc:
                 logger.error("Failed to fetch CS2 patch date (attempt %d): %s", attempt + 1, exc)
-                if attempt < 2:
-                    import time
-                    for _ in range(50):
-                        if stop_event.is_set():
-                            return
-                        time.sleep(0.1)
+                if attempt < 2 and stop_event.wait(5.0):
+                    return
 
         _update_ui("Error", _COLOR_ERR)
 
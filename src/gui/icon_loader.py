@@ -1,3 +1,5 @@
+import functools
+import platform
 from PIL import Image
 import customtkinter as ctk
 from src.utils.utility import Utility
@@ -7,10 +9,25 @@ logger = Logger.get_logger(__name__)
 
 ASSETS_DIR = "assets/assets"
 
+# Win32 constants for set_window_icon.
+_IMAGE_ICON      = 1
+_LR_LOADFROMFILE = 0x0010
+_WM_SETICON      = 0x0080
+_ICON_SMALL      = 0
+_ICON_BIG        = 1
+_SM_CXICON       = 11
+_SM_CXSMICON     = 49
+
+@functools.lru_cache(maxsize=None)
 def load_icon(filename, size=(18, 18)):
-    """Load a PNG from ASSETS_DIR and return a CTkImage, or None if not found."""
+    """Load a PNG from ASSETS_DIR and return a CTkImage, or None if not found.
+
+    Results are memoized per (filename, size): icons never change at runtime, so
+    every caller shares one decoded CTkImage instead of re-reading the PNG.
+    """
     try:
         img = Image.open(Utility.resource_path(f"{ASSETS_DIR}/{filename}"))
+        img.load()  # decode now and release the file handle
         return ctk.CTkImage(light_image=img, dark_image=img, size=size)
     except FileNotFoundError:
         logger.debug("Icon file not found: %s", filename)
@@ -28,4 +45,45 @@ def icon_label(parent, filename, size=(18, 18), padx=(0, 10), side="left"):
     lbl = ctk.CTkLabel(parent, text="", image=img, width=size[0])
     lbl.image = img  # keep reference alive
     lbl.pack(side=side, padx=padx)
-    return lbl
\ No newline at end of file
+    return lbl
+
+@functools.lru_cache(maxsize=1)
+def _user32():
+    """Private user32 handle with the signatures set_window_icon relies on."""
+    import ctypes
+    from ctypes import wintypes
+    user32 = ctypes.WinDLL("user32")
+    user32.LoadImageW.argtypes = (wintypes.HINSTANCE, wintypes.LPCWSTR, wintypes.UINT,
+                                  ctypes.c_int, ctypes.c_int, wintypes.UINT)
+    user32.LoadImageW.restype = wintypes.HANDLE
+    user32.SendMessageW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+    user32.SendMessageW.restype = wintypes.LPARAM
+    return user32
+
+@functools.lru_cache(maxsize=None)
+def _load_hicons(path):
+    """Load the small and big HICON for an .ico file once per process."""
+    user32 = _user32()
+    small, big = (
+        user32.LoadImageW(None, path, _IMAGE_ICON, size, size, _LR_LOADFROMFILE)
+        for size in (user32.GetSystemMetrics(_SM_CXSMICON), user32.GetSystemMetrics(_SM_CXICON))
+    )
+    return small, big
+
+def set_window_icon(window, path=None):
+    """Give a dialog window the app icon.
+
+    On Windows the .ico is decoded into HICONs once and handed to each window with
+    WM_SETICON, instead of every iconbitmap() call re-reading the file. Falls back
+    to iconbitmap() elsewhere or if the icon can't be loaded.
+    """
+    path = path or Utility.resource_path(f"{ASSETS_DIR}/icon.ico")
+    if platform.system() == "Windows":
+        small, big = _load_hicons(path)
+        if small and big:
+            user32 = _user32()
+            hwnd = int(window.wm_frame(), 16)
+            user32.SendMessageW(hwnd, _WM_SETICON, _ICON_SMALL, small)
+            user32.SendMessageW(hwnd, _WM_SETICON, _ICON_BIG, big)
+            return
+    window.iconbitmap(path)
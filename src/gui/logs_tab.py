@@ -7,6 +7,8 @@ from src.gui.theme import (
     COLOR_BACKGROUND,FONT_TITLE, FONT_SUBTITLE, FONT_WIDGET, FONT_LOG,
                        COLOR_TEXT_PRIMARY, COLOR_TEXT_SECONDARY, SECTION_STYLE)
 
+logger = Logger.get_logger(__name__)
+
 # Detects the start of a level-tagged log line, e.g. [INFO] or [ERROR].
 # Used to group multi-line entries (tracebacks) with their parent line.
 _LEVEL_LINE_RE = re.compile(r'\[(INFO|WARNING|ERROR|DEBUG|CRITICAL)\]')
@@ -36,7 +38,7 @@ def populate_logs(main_window, frame):
 
     create_title_section(logs_container)
 
-    logs_card = ctk.CTkFrame(logs_container, **{**SECTION_STYLE, "border_width": 0})
+    logs_card = ctk.CTkFrame(logs_container, **SECTION_STYLE)
     logs_card.pack(fill="both", expand=True)
 
     _create_toolbar(main_window, logs_card)
@@ -172,7 +174,6 @@ def _create_log_body(main_window, parent):
 
 def _initial_load(main_window) -> None:
     """Read the entire log file into the buffer, then render."""
-    logger = Logger.get_logger(__name__)
     log_path = getattr(main_window, "_active_log_file", Logger.LOG_FILE())
 
     if not os.path.exists(log_path):
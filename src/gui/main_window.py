@@ -1,4 +1,8 @@
-import copy
+import codecs
+import functools
+import importlib
+import io
+import mmap
 import os
 import platform
 import queue
@@ -6,11 +10,10 @@ import re
 import threading
 import time
 import webbrowser
+from dataclasses import dataclass
 
 import customtkinter as ctk
-from PIL import Image
 from tkinter import messagebox
-from watchdog.observers import Observer
 
 from src.utils.updater import Updater
 from src.utils.utility import Utility
@@ -20,26 +23,17 @@ from src.features.bunnyhop import CS2Bunnyhop
 from src.features.noflash import CS2NoFlash
 from src.utils.config_manager import ConfigManager
 import src.utils.profile_manager as ProfileManager
-from src.utils.file_watcher import ConfigFileChangeHandler
 from src.utils.logger import Logger
 from src.core.memory_manager import MemoryManager
 from src.core.client_manager import ClientManager
-from src.core.offset_fetcher import fetch_offsets
+from src.core.offset_fetcher import fetch_offsets, smart_reinstall_dumper
 from src.features import ghost_manager as _gm
 
 from src.gui.changelog_window import show_changelog_if_new
 from src.gui.modal import AppModal
 from src.gui.icon_loader import load_icon, ASSETS_DIR
 from src.gui.ui_config_bridge import UIConfigBridge
-from src.gui.home_tab import populate_dashboard
-from src.gui.general_settings_tab import populate_general_settings
-from src.gui.trigger_settings_tab import populate_trigger_settings
-from src.gui.overlay_settings_tab import populate_overlay_settings
-from src.gui.additional_settings_tab import populate_additional_settings
-from src.gui.logs_tab import populate_logs, _LEVEL_LINE_RE
-from src.gui.faq_tab import populate_faq
-from src.gui.notifications_tab import populate_notifications
-from src.gui.supporters_tab import populate_supporters
+from src.gui.logs_tab import _LEVEL_LINE_RE
 from src.gui.theme import (
     FONT_FAMILY_BOLD, FONT_FAMILY_REGULAR, FONT_SIZE_H2, FONT_SIZE_H4, FONT_SIZE_P,
     COLOR_TEXT_PRIMARY, COLOR_TEXT_SECONDARY, COLOR_BACKGROUND,
@@ -50,22 +44,159 @@ from src.gui.theme import (
 
 logger = Logger.get_logger(__name__)
 
+@dataclass(frozen=True)
+class _NumericRule:
+    key: str
+    low: float
+    high: float | None  # None → no upper bound
+    message: str
+
+# Checked in order by _validate_inputs; keys missing from the bridge are skipped.
+_NUMERIC_RULES = (
+    _NumericRule("ShotDelayMin",  0,  None, "Must be non-negative."),
+    _NumericRule("ShotDelayMax",  0,  None, "Must be non-negative."),
+    _NumericRule("PostShotDelay", 0,  None, "Must be non-negative."),
+    _NumericRule("target_fps",    60, 420,  "Must be between 60 and 420."),
+)
+# Settings view key -> (loader, saver) method names; drives per-tab refresh and save.
+_SETTINGS_TABS = {
+    "general_settings":    ("_load_general",    "_save_general"),
+    "trigger_settings":    ("_load_trigger",    "_save_trigger"),
+    "overlay_settings":    ("_load_overlay",    "_save_overlay"),
+    "additional_settings": ("_load_additional", "_save_additional"),
+}
+
+_REQUIRED_TEXT = (
+    ("TriggerKey", "Trigger key cannot be empty."),
+    ("JumpKey",    "Jump key cannot be empty."),
+)
+
+@dataclass(frozen=True)
+class _NavItem:
+    section: str | None  # None → no header for that group (Dashboard stands alone)
+    label: str
+    key: str
+    icon: str
+
+# view key -> "module:function". Tab modules are imported on first populate so their
+# own dependencies load after the root window exists instead of at import time.
+_TAB_POPULATORS = {
+    "dashboard":           "src.gui.home_tab:populate_dashboard",
+    "general_settings":    "src.gui.general_settings_tab:populate_general_settings",
+    "trigger_settings":    "src.gui.trigger_settings_tab:populate_trigger_settings",
+    "overlay_settings":    "src.gui.overlay_settings_tab:populate_overlay_settings",
+    "additional_settings": "src.gui.additional_settings_tab:populate_additional_settings",
+    "logs":                "src.gui.logs_tab:populate_logs",
+    "faq":                 "src.gui.faq_tab:populate_faq",
+    "notifications":       "src.gui.notifications_tab:populate_notifications",
+    "supporters":          "src.gui.supporters_tab:populate_supporters",
+}
+
+# Quiet period before a burst of widget changes is written to disk.
+_SAVE_DEBOUNCE_MS = 300
+
+# Most log entries kept in the in-memory buffer behind the logs tab.
+_LOG_BUFFER_CAP = 10_000
+
+# Window in which config-watcher refreshes are merged into one UI update.
+_UI_REFRESH_DEBOUNCE_MS = 150
+
+# How often the Tk thread drains callbacks queued by worker threads.
+_UI_QUEUE_POLL_MS = 50
+
+# Log tail poll interval without / with the watchdog log handler.
+_LOG_POLL_MS = 2000
+_LOG_SAFETY_POLL_MS = 10000
+
+_UI_FONTS = (
+    "assets/fonts/Outfit-Regular.ttf", "assets/fonts/Outfit-Bold.ttf",
+    "assets/fonts/JetBrainsMono-Regular.ttf", "assets/fonts/JetBrainsMono-Bold.ttf",
+)
+# AddFontResourceExW flag: fonts are visible to this process only.
+_FR_PRIVATE = 0x10
+
+_EAGER_TABS = ("dashboard",)
+
+# Config keys <-> UI bridge keys, shared by the _save_* and _load_* passes.
+_GENERAL_KEYS = ("Trigger", "Overlay", "Bunnyhop", "Noflash", "Disguise", "DetailedLogs")
+_TRIGGER_KEYS = ("TriggerKey", "ToggleMode", "AttackOnTeammates")
+_DELAY_DEFAULTS = {"ShotDelayMin": 0.01, "ShotDelayMax": 0.03, "PostShotDelay": 0.1}
+_OVERLAY_FLAGS = (
+    "enable_box", "enable_skeleton", "draw_snaplines", "draw_bomb_timer",
+    "draw_health_numbers", "draw_armor", "draw_nicknames", "draw_weapon_names", "draw_teammates",
+    "draw_scoped", "draw_reloading", "draw_flashed", "draw_defusing", "draw_money",
+    "draw_distance", "draw_sniper_crosshair", "draw_spectators", "spectators_detailed", "spectators_self_only",
+)
+_OVERLAY_COLORS = {
+    "box_color_hex":       "#FFA500",
+    "snaplines_color_hex": "#FFFFFF",
+    "text_color_hex":      "#FFFFFF",
+    "weapon_color_hex":    "#FFFFFF",
+    "teammate_color_hex":  "#00FFFF",
+}
+_OVERLAY_CHOICES = {
+    "bomb_timer_position": "Center-Left",
+    "spectators_position": "Center-Right",
+    "overlay_font":        "Inter",
+}
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+_NAV_ITEMS = (
+    _NavItem(None,       "Dashboard",           "dashboard",           "charts_icon.png"),
+    _NavItem("SETTINGS", "General Settings",    "general_settings",    "gear_icon.png"),
+    _NavItem(None,       "Trigger Settings",    "trigger_settings",    "crosshairs_icon.png"),
+    _NavItem(None,       "Overlay Settings",    "overlay_settings",    "layer_group_icon.png"),
+    _NavItem(None,       "Additional Settings", "additional_settings", "bolt_icon.png"),
+    _NavItem("TOOLS",    "Logs",                "logs",                "clipboard_list_icon.png"),
+    _NavItem("INFO",     "FAQ",                 "faq",                 "circle_question_icon.png"),
+    _NavItem(None,       "Notifications",       "notifications",       "bell_icon.png"),
+    _NavItem(None,       "Supporters",          "supporters",          "handshake_icon.png"),
+)
+
+# Shared CTkButton options for the sidebar and header link buttons; only the
+# per-item text, image and command are passed at each call site.
+_NAV_BUTTON_STYLE = {
+    "compound": "left", "height": 46, "corner_radius": 10, "fg_color": "transparent",
+    "hover_color": COLOR_SIDEBAR_ACTIVE_BG, "text_color": COLOR_TEXT_SECONDARY,
+    "font": (FONT_FAMILY_BOLD[0], FONT_SIZE_H4), "anchor": "w",
+}
+_SOCIAL_BUTTON_STYLE = {
+    "compound": "left", "height": 36, "corner_radius": 10, "fg_color": "transparent",
+    "hover_color": COLOR_SIDEBAR_ACTIVE_BG,
+    "border_width": 1, "border_color": ("#c4b5fd", "#3d2a6e"),
+    "text_color": ("#7c3aed", "#a78bfa"),
+    "font": (FONT_FAMILY_BOLD[0], FONT_SIZE_P, "bold"),
+}
+_SOCIAL_LINKS = (
+    ("GitHub",   "github_icon.png",    "https://github.com/Jesewe/VioletWing"),
+    ("Telegram", "telegram_icon.png",  "https://t.me/cs2_jesewe"),
+    ("Website",  "book_open_icon.png", "https://violetwing.vercel.app/"),
+)
+
 class MainWindow:
     def __init__(self) -> None:
         self.repo_url = "github.com/Jesewe/VioletWing"
 
-        # Thread handles
-        self.trigger_thread = None
-        self.overlay_thread = None
-        self.bunnyhop_thread = None
-        self.noflash_thread = None
         self.observer = None
         self._suppress_watcher = False
         self.ui_queue: queue.SimpleQueue = queue.SimpleQueue()
         self.log_timer = None
+        self._log_watch_active = False
+        self._notifications_cache: list | None = None
         self._log_file_pos = 0
+        self._log_file_mtime_ns = 0
+        # Decodes appended log bytes the way logs_tab's text-mode read does:
+        # CRLF -> LF, and a UTF-8 sequence or CRLF split across two reads is held
+        # back until the rest arrives. Valid only while _log_decoder_pos matches.
+        self._log_decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")("replace"), translate=True,
+        )
+        self._log_decoder_pos = 0
         self._active_log_file: str = Logger.LOG_FILE()
 
+        # Set by logs_tab when the logs view is first built.
+        self.log_text = None
+
         # Log buffer: each element is one logical entry (may span multiple lines).
         # The widget is a read-only view of this buffer filtered by level + search.
         self._log_lines: list[str] = []
@@ -78,6 +209,26 @@ class MainWindow:
         self._fetch_update_stop: threading.Event | None = None
         self._fetch_patch_stop: threading.Event | None = None
         self._process_monitor_timer: str | None = None
+        self._sysmon_executor = None
+
+        # Resolved tab populate functions, filled lazily by _populate_tab.
+        self._tab_populators: dict = {}
+
+        # Font files registered with AddFontResourceExW; removed again in cleanup().
+        self._private_font_paths: list[str] = []
+
+        # Last (text, color) shown by update_client_status.
+        self._client_status: tuple[str, str] | None = None
+
+        # Pending root.after ids from schedule_save() / schedule_ui_refresh().
+        self._save_after_id: str | None = None
+        self._ui_refresh_after_id: str | None = None
+
+        # Built settings tabs whose widgets predate the last update_ui_from_config.
+        self._stale_tabs: set[str] = set()
+
+        # Config sections changed by the current save_settings pass.
+        self._dirty_sections: set[str] = set()
 
         # Tracks the last successfully loaded profile name; cleared on manual save.
         self.active_profile_name: str | None = None
@@ -100,9 +251,9 @@ class MainWindow:
         # Set title dynamically based on active ghost
         title = self.ghost["name"] if self.ghost else "VioletWing"
         self.root.title(title)
-        self.root.resizable(True, True)
         self.root.minsize(1400, 800)
-        self.root.update_idletasks()
+        # winfo_screen* needs no idle pass; flushing one here would map the empty
+        # root at its default size before geometry() and the widgets arrive.
         x = (self.root.winfo_screenwidth() // 2) - 700
         y = (self.root.winfo_screenheight() // 2) - 400
         self.root.geometry(f"1400x800+{x}+{y}")
@@ -128,16 +279,7 @@ class MainWindow:
             app_id = f'VioletWing.Ghost.{self.ghost["id"]}' if self.ghost else 'VioletWing.App.Main'
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
             
-            gdi32 = ctypes.WinDLL("gdi32")
-            for font in [
-                "assets/fonts/Outfit-Regular.ttf", "assets/fonts/Outfit-Bold.ttf",
-                "assets/fonts/JetBrainsMono-Regular.ttf", "assets/fonts/JetBrainsMono-Bold.ttf",
-            ]:
-                path = Utility.resource_path(font)
-                if os.path.exists(path):
-                    gdi32.AddFontResourceW(path)
-                else:
-                    logger.warning("Font not found: %s", path)
+            self._register_private_fonts(ctypes)
 
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(1, weight=1)
@@ -145,7 +287,6 @@ class MainWindow:
         self.updater = Updater(self)
         self.setup_ui()
         self.init_config_watcher()
-        self.start_log_timer()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         self.client_manager = ClientManager(self)
@@ -154,6 +295,42 @@ class MainWindow:
         # UI is fully visible before the modal changelog window appears.
         self.root.after(0, self._start_release_fetch)
 
+    def _register_private_fonts(self, ctypes) -> None:
+        """Register the UI fonts with GDI for this process only (FR_PRIVATE).
+
+        AddFontResourceExW keeps the fonts enumerable, which Tk relies on to
+        resolve family names; memory-loaded fonts are hidden from enumeration.
+        Registered paths are released in cleanup().
+
+        Runs before setup_ui() on purpose: Tk resolves a family when a widget is
+        created and caches the result, so widgets built before registration keep
+        the fallback font. A missing file just makes the call fail, so there is
+        no separate exists() check.
+        """
+        from ctypes import wintypes
+        gdi32 = ctypes.WinDLL("gdi32")
+        add_font = gdi32.AddFontResourceExW
+        add_font.argtypes = (wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPVOID)
+        add_font.restype = ctypes.c_int
+        for font in _UI_FONTS:
+            path = Utility.resource_path(font)
+            if add_font(path, _FR_PRIVATE, None):
+                self._private_font_paths.append(path)
+            else:
+                logger.warning("Could not register font (missing or invalid): %s", path)
+
+    def _release_private_fonts(self) -> None:
+        if not self._private_font_paths:
+            return
+        import ctypes
+        from ctypes import wintypes
+        remove_font = ctypes.WinDLL("gdi32").RemoveFontResourceExW
+        remove_font.argtypes = (wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPVOID)
+        remove_font.restype = wintypes.BOOL
+        for path in self._private_font_paths:
+            remove_font(path, _FR_PRIVATE, None)
+        self._private_font_paths.clear()
+
     def initialize_features(self) -> None:
         try:
             self.triggerbot = CS2TriggerBot(self.memory_manager)
@@ -161,10 +338,10 @@ class MainWindow:
             self.bunnyhop   = CS2Bunnyhop(self.memory_manager)
             self.noflash    = CS2NoFlash(self.memory_manager)
             self.features = {
-                "Trigger":  {"name": "TriggerBot", "instance": self.triggerbot, "class": CS2TriggerBot},
-                "Overlay":  {"name": "Overlay",    "instance": self.overlay,    "class": CS2Overlay},
-                "Bunnyhop": {"name": "Bunnyhop",   "instance": self.bunnyhop,   "class": CS2Bunnyhop},
-                "Noflash":  {"name": "Noflash",    "instance": self.noflash,    "class": CS2NoFlash},
+                "Trigger":  {"name": "TriggerBot", "instance": self.triggerbot, "class": CS2TriggerBot, "section": "Trigger", "thread": None, "pending_start": None},
+                "Overlay":  {"name": "Overlay",    "instance": self.overlay,    "class": CS2Overlay,    "section": "Overlay", "thread": None, "pending_start": None},
+                "Bunnyhop": {"name": "Bunnyhop",   "instance": self.bunnyhop,   "class": CS2Bunnyhop,   "section": "Bunnyhop","thread": None, "pending_start": None},
+                "Noflash":  {"name": "Noflash",    "instance": self.noflash,    "class": CS2NoFlash,    "section": "NoFlash", "thread": None, "pending_start": None},
             }
             logger.info("All features initialised.")
         except Exception:
@@ -188,12 +365,10 @@ class MainWindow:
     def create_header_left(self, parent) -> None:
         lf = ctk.CTkFrame(parent, fg_color="transparent")
         lf.grid(row=0, column=0, sticky="w", padx=30, pady=15)
-        tf = ctk.CTkFrame(lf, fg_color="transparent")
-        tf.pack(side="left")
-        
+
         # Display the disguised name in the header, or default to VioletWing.
         header_text = self.ghost["name"] if self.ghost else "VioletWing"
-        ctk.CTkLabel(tf, text=header_text, font=(FONT_FAMILY_BOLD[0], FONT_SIZE_H2, "bold"),
+        ctk.CTkLabel(lf, text=header_text, font=(FONT_FAMILY_BOLD[0], FONT_SIZE_H2, "bold"),
                      text_color="#f0ebff").pack(side="left")
         badge = ctk.CTkFrame(lf, fg_color=COLOR_VIOLET_SUBTLE, corner_radius=8, height=26)
         badge.pack(side="left", padx=(15, 0))
@@ -226,22 +401,13 @@ class MainWindow:
     def create_social_buttons(self, parent) -> ctk.CTkFrame:
         sf = ctk.CTkFrame(parent, fg_color="transparent")
         sf.pack(side="right")
-        socials = [
-            ("GitHub",   "github_icon.png",    "https://github.com/Jesewe/VioletWing"),
-            ("Telegram", "telegram_icon.png",  "https://t.me/cs2_jesewe"),
-            ("Website",  "book_open_icon.png", "https://violetwing.vercel.app/"),
-        ]
-        for i, (text, icon_file, url) in enumerate(socials):
-            ci = load_icon(icon_file)
+        last = len(_SOCIAL_LINKS) - 1
+        for i, (text, icon_file, url) in enumerate(_SOCIAL_LINKS):
             ctk.CTkButton(
-                sf, text=text, image=ci, compound="left",
-                command=lambda u=url: webbrowser.open(u),
-                height=36, corner_radius=10, fg_color="transparent",
-                hover_color=COLOR_SIDEBAR_ACTIVE_BG,
-                border_width=1, border_color=("#c4b5fd", "#3d2a6e"),
-                text_color=("#7c3aed", "#a78bfa"),
-                font=(FONT_FAMILY_BOLD[0], FONT_SIZE_P, "bold"),
-            ).pack(side="left", padx=(0, 8) if i < len(socials) - 1 else (0, 0))
+                sf, text=text, image=load_icon(icon_file),
+                command=functools.partial(webbrowser.open, url),
+                **_SOCIAL_BUTTON_STYLE,
+            ).pack(side="left", padx=(0, 8) if i < last else (0, 0))
         return sf
 
     def create_toast_notification(self) -> None:
@@ -347,18 +513,20 @@ class MainWindow:
         self.updater.fetch_in_background(self._on_release_fetched)
 
     def _start_ui_queue_drain(self) -> None:
-        def _drain():
-            try:
-                while True:
-                    fn = self.ui_queue.get_nowait()
-                    try:
-                        fn()
-                    except Exception:
-                        logger.exception("ui_queue callback raised")
-            except queue.Empty:
-                pass
-            self.root.after(10, _drain)
-        self.root.after(10, _drain)
+        self._drain_ui_queue()
+
+    def _drain_ui_queue(self) -> None:
+        # Polled from the Tk thread only: workers never touch Tk, they just put().
+        try:
+            while True:
+                fn = self.ui_queue.get_nowait()
+                try:
+                    fn()
+                except Exception:
+                    logger.exception("ui_queue callback raised")
+        except queue.Empty:
+            pass
+        self.root.after(_UI_QUEUE_POLL_MS, self._drain_ui_queue)
 
     def ui_queue_put(self, fn) -> None:
         """Submit a zero-argument callable to run on the main thread. Thread-safe."""
@@ -391,53 +559,51 @@ class MainWindow:
             "notifications":       self.populate_notifications,
             "supporters":          self.populate_supporters,
         }
+        # Tabs are built the first time switch_view shows them. Only the dashboard,
+        # whose populate starts its polling, is built up front; the unread badge
+        # comes from a feed prefetch that the notifications tab later reuses.
         self.tab_frames: dict[str, ctk.CTkFrame] = {}
-        for key, fn in self.tab_views.items():
-            frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-            self.tab_frames[key] = frame
-            fn(frame)
+        for key in _EAGER_TABS:
+            self._build_tab(key)
+        from src.gui.notifications_tab import prefetch_notification_badge
+        prefetch_notification_badge(self)
 
         self.current_view = None
         self.switch_view("dashboard")
 
+    def _build_tab(self, view_key: str) -> ctk.CTkFrame:
+        frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.tab_frames[view_key] = frame
+        self.tab_views[view_key](frame)
+        return frame
+
     def create_sidebar(self, parent) -> None:
         sidebar = ctk.CTkFrame(parent, width=280, corner_radius=0, fg_color=COLOR_SIDEBAR_BG)
         sidebar.grid(row=0, column=0, sticky="nsew")
         sidebar.grid_propagate(False)
 
-        # section_label=None → no header for that group (Dashboard stands alone)
-        nav_items = [
-            (None,       "Dashboard",           "dashboard",           "charts_icon.png"),
-            ("SETTINGS", "General Settings",    "general_settings",    "gear_icon.png"),
-            (None,       "Trigger Settings",    "trigger_settings",    "crosshairs_icon.png"),
-            (None,       "Overlay Settings",    "overlay_settings",    "layer_group_icon.png"),
-            (None,       "Additional Settings", "additional_settings", "bolt_icon.png"),
-            ("TOOLS",    "Logs",                "logs",                "clipboard_list_icon.png"),
-            ("INFO",     "FAQ",                 "faq",                 "circle_question_icon.png"),
-            (None,       "Notifications",       "notifications",       "bell_icon.png"),
-            (None,       "Supporters",          "supporters",          "handshake_icon.png"),
-        ]
-
         ctk.CTkFrame(sidebar, height=1, fg_color=("#c4b5fd", "#2a1d4e")).pack(fill="x")
         ctk.CTkFrame(sidebar, height=20, fg_color="transparent").pack(fill="x")
 
         self.nav_buttons: dict[str, ctk.CTkButton] = {}
         self.nav_indicators: dict[str, ctk.CTkFrame] = {}
         self._nav_images: dict = {}
+        self._active_nav_key: str | None = None
 
-        for section_label, name, key, icon_file in nav_items:
-            if section_label is not None:
+        for item in _NAV_ITEMS:
+            key = item.key
+            if item.section is not None:
                 ctk.CTkFrame(sidebar, height=1, fg_color=("#c4b5fd", "#2a1d4e")).pack(
                     fill="x", padx=16, pady=(10, 0)
                 )
                 ctk.CTkLabel(
                     sidebar,
-                    text=section_label,
+                    text=item.section,
                     font=(FONT_FAMILY_BOLD[0], 10, "bold"),
                     text_color=COLOR_TEXT_SECONDARY,
                     anchor="w",
                 ).pack(fill="x", padx=24, pady=(6, 2))
-            ci = load_icon(icon_file)
+            ci = load_icon(item.icon)
             self._nav_images[key] = ci
 
             row = ctk.CTkFrame(sidebar, fg_color="transparent", height=50)
@@ -448,13 +614,9 @@ class MainWindow:
             indicator.pack(side="left", fill="y", padx=(8, 0))
 
             btn = ctk.CTkButton(
-                row, text=name, image=ci, compound="left",
-                command=lambda k=key: self.switch_view(k),
-                height=46, corner_radius=10, fg_color="transparent",
-                hover_color=COLOR_SIDEBAR_ACTIVE_BG,
-                text_color=COLOR_TEXT_SECONDARY,
-                font=(FONT_FAMILY_BOLD[0], FONT_SIZE_H4),
-                anchor="w",
+                row, text=item.label, image=ci,
+                command=functools.partial(self.switch_view, key),
+                **_NAV_BUTTON_STYLE,
             )
             if key == "notifications":
                 btn.pack(side="left", fill="x", expand=True, padx=(6, 4))
@@ -485,15 +647,17 @@ class MainWindow:
             self._notification_badge_frame.pack_forget()
 
     def set_active_nav(self, active_key: str) -> None:
-        for key, btn in self.nav_buttons.items():
-            ind = self.nav_indicators[key]
-            if key == active_key:
-                btn.configure(fg_color=COLOR_SIDEBAR_ACTIVE_BG, text_color=COLOR_TEXT_PRIMARY)
-                ind.configure(fg_color=COLOR_SIDEBAR_INDICATOR)
-            else:
-                btn.configure(fg_color="transparent", text_color=COLOR_TEXT_SECONDARY,
-                              hover_color=COLOR_SIDEBAR_ACTIVE_BG)
-                ind.configure(fg_color="transparent")
+        # Buttons are built in the inactive style, so only the outgoing and
+        # incoming entries need reconfiguring.
+        previous = self._active_nav_key
+        if previous == active_key:
+            return
+        if previous is not None:
+            self.nav_buttons[previous].configure(fg_color="transparent", text_color=COLOR_TEXT_SECONDARY)
+            self.nav_indicators[previous].configure(fg_color="transparent")
+        self.nav_buttons[active_key].configure(fg_color=COLOR_SIDEBAR_ACTIVE_BG, text_color=COLOR_TEXT_PRIMARY)
+        self.nav_indicators[active_key].configure(fg_color=COLOR_SIDEBAR_INDICATOR)
+        self._active_nav_key = active_key
 
     def switch_view(self, view_key: str) -> None:
         if self.current_view == view_key:
@@ -504,31 +668,49 @@ class MainWindow:
             self.root.update_idletasks()
         self.current_view = view_key
         self.set_active_nav(view_key)
-        if view_key in self.tab_frames:
-            self.tab_frames[view_key].pack(fill="both", expand=True)
-
-    def populate_dashboard(self, frame):           populate_dashboard(self, frame)
-    def populate_general_settings(self, frame):    populate_general_settings(self, frame)
-    def populate_trigger_settings(self, frame):    populate_trigger_settings(self, frame)
-    def populate_overlay_settings(self, frame):    populate_overlay_settings(self, frame)
-    def populate_additional_settings(self, frame): populate_additional_settings(self, frame)
-    def populate_logs(self, frame):                populate_logs(self, frame)
-    def populate_faq(self, frame):                 populate_faq(self, frame)
-    def populate_notifications(self, frame):       populate_notifications(self, frame)
-    def populate_supporters(self, frame):          populate_supporters(self, frame)
+        frame = self.tab_frames.get(view_key)
+        if frame is None and view_key in self.tab_views:
+            frame = self._build_tab(view_key)
+        if frame is not None:
+            self._refresh_stale_tab(view_key)
+            frame.pack(fill="both", expand=True)
+        if view_key == "logs":
+            # Writes while the tab was hidden were ignored; catch up and resume polling.
+            self.start_log_timer()
+
+    def _populate_tab(self, view_key: str, frame) -> None:
+        """Import the tab module on first use, cache its populate function, and call it."""
+        fn = self._tab_populators.get(view_key)
+        if fn is None:
+            module_name, func_name = _TAB_POPULATORS[view_key].split(":")
+            fn = getattr(importlib.import_module(module_name), func_name)
+            self._tab_populators[view_key] = fn
+        fn(self, frame)
+
+    def populate_dashboard(self, frame):           self._populate_tab("dashboard", frame)
+    def populate_general_settings(self, frame):    self._populate_tab("general_settings", frame)
+    def populate_trigger_settings(self, frame):    self._populate_tab("trigger_settings", frame)
+    def populate_overlay_settings(self, frame):    self._populate_tab("overlay_settings", frame)
+    def populate_additional_settings(self, frame): self._populate_tab("additional_settings", frame)
+    def populate_logs(self, frame):                self._populate_tab("logs", frame)
+    def populate_faq(self, frame):                 self._populate_tab("faq", frame)
+    def populate_notifications(self, frame):       self._populate_tab("notifications", frame)
+    def populate_supporters(self, frame):          self._populate_tab("supporters", frame)
 
     def fetch_offsets_async(self, on_success: callable = None) -> None:
         self._offsets_fetching = True
 
         def _worker():
             try:
+                # Purge a dumper older than the last CS2 patch before it runs. Only
+                # a dump needs this, so it stays off the Start click path.
+                smart_reinstall_dumper()
                 offsets, client, buttons = fetch_offsets()
                 if None in (offsets, client, buttons):
                     raise ValueError("fetch_offsets() returned None.")
-                self.root.after(0, lambda: self._on_offsets_ready(offsets, client, buttons, on_success))
+                self.root.after(0, self._on_offsets_ready, offsets, client, buttons, on_success)
             except Exception:
                 logger.exception("Failed to fetch offsets.")
-                self._offsets_fetching = False
                 self.root.after(0, self._on_offsets_failed)
 
         threading.Thread(target=_worker, daemon=True).start()
@@ -540,64 +722,81 @@ class MainWindow:
         self._offsets_fetching = False
         if hasattr(self.memory_manager, "_apply_offsets"):
             self.memory_manager._apply_offsets()
-        if hasattr(self, "loading_label"):
-            self.loading_label.destroy()
-            del self.loading_label
         if on_success is not None:
             on_success()
 
     def _on_offsets_failed(self) -> None:
+        self._offsets_fetching = False
         self.update_client_status("Inactive", "#ef4444")
         AppModal.error(self.root, "Offset Error", "Failed to fetch offsets. Check logs.")
-        if hasattr(self, "loading_label"):
-            self.loading_label.configure(text="Failed to load offsets.", text_color="#ef4444")
 
     def update_client_status(self, status: str, color: str) -> None:
+        # Every save re-reports the status; skip the Tcl round-trips when nothing changed.
+        if self._client_status == (status, color):
+            return
+        self._client_status = (status, color)
         self.status_label.configure(text=status, text_color=color)
         self.status_dot.configure(fg_color=color)
-        if hasattr(self, "bot_status_label"):
-            self.bot_status_label.configure(text=status, text_color=color)
 
     def start_client(self):
         self.client_manager.start_client()
 
-    def stop_client(self) -> None:
-        self.client_manager.stop_client()
+    def stop_client(self, wait: bool = False) -> None:
+        self.client_manager.stop_client(wait=wait)
 
     def update_weapon_settings_display(self) -> None:
         weapon_type = self.ui_bridge.get_value("active_weapon_type")
         if weapon_type is None:
             return
-        config = ConfigManager.load_config()
-        ws = config["Trigger"]["WeaponSettings"].get(weapon_type, {})
+        ws = ConfigManager.get_value("Trigger", "WeaponSettings", weapon_type, default={})
         
-        for key, default in [("ShotDelayMin", 0.01), ("ShotDelayMax", 0.03), ("PostShotDelay", 0.1)]:
+        for key, default in _DELAY_DEFAULTS.items():
             self.ui_bridge.set_value(key, str(ws.get(key, default)))
             self._flash_widget(key)
 
     def _flash_widget(self, key: str) -> None:
-        if not self.ui_bridge.registered(key):
-            return
         entry = self.ui_bridge._registry.get(key)
-        if entry is None:
-            return
-        widget = entry.get("widget")
-        if not widget or not hasattr(widget, "configure"):
+        widget = entry["widget"] if entry is not None else None
+        if widget is None:
             return
-            
-        if not hasattr(widget, "_orig_fg_color"):
+
+        if getattr(widget, "_orig_fg_color", None) is None:
             widget._orig_fg_color = widget.cget("fg_color")
-            
+
         widget.configure(fg_color=COLOR_VIOLET_SUBTLE)
-        
-        if hasattr(widget, "_flash_timer") and widget._flash_timer:
-            self.root.after_cancel(widget._flash_timer)
+
+        timer = getattr(widget, "_flash_timer", None)
+        if timer:
+            self.root.after_cancel(timer)
             
         widget._flash_timer = self.root.after(
             400, lambda: widget.configure(fg_color=widget._orig_fg_color)
         )
 
+    def schedule_save(self, show_message: bool = False) -> None:
+        """Trailing-edge debounced save for widget callbacks.
+
+        Rapid changes (slider drags, checkbox bursts, entry commits) restart the
+        timer, so they collapse into a single save_settings() _SAVE_DEBOUNCE_MS
+        after the last one.
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(_SAVE_DEBOUNCE_MS, self.save_settings, show_message)
+
+    def on_widget_change(self, *_args) -> None:
+        """Widget callback that schedules a save, ignoring the event/value Tk passes in."""
+        self.schedule_save()
+
+    def flush_pending_save(self) -> None:
+        """Run a scheduled save immediately, if one is pending."""
+        if self._save_after_id is not None:
+            self.save_settings(show_message=False)
+
     def save_settings(self, show_message: bool = False) -> None:
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         try:
             self.ui_bridge.clear_errors()
             errors = self._validate_inputs()
@@ -608,18 +807,26 @@ class MainWindow:
                 return
 
             config = ConfigManager.load_config()
-            old_config = copy.deepcopy(config)
+            # Only General drives feature start/stop, so that is all we snapshot;
+            # the rest of the diff is tracked per section by the _save_* helpers.
+            old_general = dict(config["General"])
+            self._dirty_sections.clear()
             self._update_config_from_ui(config)
-            self._suppress_watcher = True
-            try:
-                ConfigManager.save_config(config, log_info=False)
-            finally:
-                self._suppress_watcher = False
-            self.client_manager.apply_feature_state_changes(old_config, config)
-            self.client_manager.update_running_feature_configs(config)
-            self.active_profile_name = None
-            self.update_active_profile_label()
-            
+
+            if self._dirty_sections:
+                # The write happens on ConfigManager's writer thread; the watcher
+                # recognises it as our own save by its mtime.
+                ConfigManager.save_config_async(config)
+                started = set()
+                if "General" in self._dirty_sections:
+                    started = self.client_manager.apply_feature_state_changes({"General": old_general}, config)
+                self.client_manager.update_running_feature_configs(
+                    config, sections=self._dirty_sections, skip=started,
+                )
+                self.active_profile_name = None
+                self.update_active_profile_label()
+                self._dirty_sections.clear()
+
             if show_message:
                 self.show_saved_toast("Configuration saved successfully.")
             else:
@@ -628,102 +835,116 @@ class MainWindow:
             logger.exception("Unexpected error while saving settings.")
             self.show_saved_toast("An unexpected error occurred.", is_error=True)
 
+    def _assign(self, section: dict, section_name: str, key: str, value) -> None:
+        """Write value into section[key] and mark section_name dirty if it changed."""
+        if section.get(key) != value:
+            section[key] = value
+            self._dirty_sections.add(section_name)
+
     def _update_config_from_ui(self, config: dict) -> None:
-        self._save_general(config)
-        self._save_trigger(config)
-        self._save_overlay(config)
-        self._save_additional(config)
+        for view_key, (_load, save) in _SETTINGS_TABS.items():
+            # A stale tab still shows pre-reload values; config already has the new ones.
+            if view_key not in self._stale_tabs:
+                getattr(self, save)(config)
 
     def _save_general(self, config: dict) -> None:
         s = config["General"]
-        for key in ("Trigger", "Overlay", "Bunnyhop", "Noflash", "Disguise", "DetailedLogs"):
+        for key in _GENERAL_KEYS:
             val = self.ui_bridge.get_value(key)
             if val is not None:
-                s[key] = val
+                self._assign(s, "General", key, val)
 
     def _save_trigger(self, config: dict) -> None:
         s = config["Trigger"]
-        for key in ("TriggerKey", "ToggleMode", "AttackOnTeammates"):
+        for key in _TRIGGER_KEYS:
             val = self.ui_bridge.get_value(key)
             if val is not None:
-                s[key] = val.strip() if key == "TriggerKey" else val
-        if self.ui_bridge.registered("active_weapon_type"):
-            wt = self.ui_bridge.get_value("active_weapon_type")
-            s["active_weapon_type"] = wt
+                self._assign(s, "Trigger", key, val.strip() if key == "TriggerKey" else val)
+        wt = self.ui_bridge.get_value("active_weapon_type")
+        if wt is not None:
+            self._assign(s, "Trigger", "active_weapon_type", wt)
             ws = s["WeaponSettings"].setdefault(wt, {})
-            for dk in ("ShotDelayMin", "ShotDelayMax", "PostShotDelay"):
+            for dk in _DELAY_DEFAULTS:
                 raw = self.ui_bridge.get_value(dk)
                 if raw is not None:
                     try:
-                        ws[dk] = float(raw)
+                        self._assign(ws, "Trigger", dk, float(raw))
                     except ValueError:
                         pass
 
     def _save_overlay(self, config: dict) -> None:
         s = config["Overlay"]
-        checkboxes = (
-            "enable_box", "enable_skeleton", "draw_snaplines", "draw_bomb_timer",
-            "draw_health_numbers", "draw_armor", "draw_nicknames", "draw_weapon_names", "draw_teammates",
-            "draw_scoped", "draw_reloading", "draw_flashed", "draw_defusing", "draw_money",
-            "draw_distance", "draw_sniper_crosshair", "draw_spectators", "spectators_detailed", "spectators_self_only",
-        )
-        for key in checkboxes:
+        for key in _OVERLAY_FLAGS:
             val = self.ui_bridge.get_value(key)
             if val is not None:
-                s[key] = val
+                self._assign(s, "Overlay", key, val)
 
         val = self.ui_bridge.get_value("box_line_thickness")
         if val is not None:
-            s["box_line_thickness"] = val
+            self._assign(s, "Overlay", "box_line_thickness", val)
 
         val = self.ui_bridge.get_value("target_fps")
         if val is not None:
             try:
-                s["target_fps"] = int(float(val))
+                self._assign(s, "Overlay", "target_fps", int(float(val)))
             except (ValueError, TypeError):
                 pass
 
-        color_defaults = {
-            "box_color_hex":       "#FFA500",
-            "snaplines_color_hex": "#FFFFFF",
-            "text_color_hex":      "#FFFFFF",
-            "weapon_color_hex":    "#FFFFFF",
-            "teammate_color_hex":  "#00FFFF",
-        }
-        for key, default in color_defaults.items():
+        for key, default in _OVERLAY_COLORS.items():
             val = self.ui_bridge.get_value(key)
             if val is not None:
-                s[key] = val.upper() if re.match(r'^#[0-9A-Fa-f]{6}$', val) else default
-                
-        pos = self.ui_bridge.get_value("bomb_timer_position")
-        if pos is not None:
-            s["bomb_timer_position"] = pos
-            
-        spos = self.ui_bridge.get_value("spectators_position")
-        if spos is not None:
-            s["spectators_position"] = spos
+                self._assign(s, "Overlay", key, val.upper() if _HEX_COLOR_RE.match(val) else default)
 
-        font = self.ui_bridge.get_value("overlay_font")
-        if font is not None:
-            s["overlay_font"] = font
+        for key in _OVERLAY_CHOICES:
+            val = self.ui_bridge.get_value(key)
+            if val is not None:
+                self._assign(s, "Overlay", key, val)
 
     def _save_additional(self, config: dict) -> None:
         bh = config.setdefault("Bunnyhop", {})
         jk = self.ui_bridge.get_value("JumpKey")
         if jk is not None:
-            bh["JumpKey"] = jk.strip()
+            self._assign(bh, "Bunnyhop", "JumpKey", jk.strip())
+
+    def schedule_ui_refresh(self) -> None:
+        """Coalesce external-change refreshes into one update_ui_from_config().
+
+        Must run on the Tk thread; the file watcher reaches it via root.after(0, ...).
+        """
+        if self._ui_refresh_after_id is not None:
+            self.root.after_cancel(self._ui_refresh_after_id)
+        self._ui_refresh_after_id = self.root.after(_UI_REFRESH_DEBOUNCE_MS, self._run_ui_refresh)
+
+    def _run_ui_refresh(self) -> None:
+        self._ui_refresh_after_id = None
+        self.update_ui_from_config()
 
     def update_ui_from_config(self) -> None:
-        config = ConfigManager.load_config()
+        # Read-only pass over the cached config; no deepcopy needed.
+        # Only the visible settings tab is refreshed now; other built tabs are
+        # marked stale and refreshed by switch_view when next shown.
+        config = ConfigManager.get_value()
         with self.ui_bridge.batch_updates(self.root):
-            self._load_general(config)
-            self._load_trigger(config)
-            self._load_overlay(config)
-            self._load_additional(config)
+            for view_key, (load, _save) in _SETTINGS_TABS.items():
+                if view_key not in self.tab_frames:
+                    continue  # not built yet; populate reads the live config
+                if view_key == self.current_view:
+                    self._stale_tabs.discard(view_key)
+                    getattr(self, load)(config)
+                else:
+                    self._stale_tabs.add(view_key)
+
+    def _refresh_stale_tab(self, view_key: str) -> None:
+        if view_key not in self._stale_tabs:
+            return
+        self._stale_tabs.discard(view_key)
+        load, _save = _SETTINGS_TABS[view_key]
+        with self.ui_bridge.batch_updates(self.root):
+            getattr(self, load)(ConfigManager.get_value())
 
     def _load_general(self, config: dict) -> None:
         s = config["General"]
-        for key in ("Trigger", "Overlay", "Bunnyhop", "Noflash", "Disguise", "DetailedLogs"):
+        for key in _GENERAL_KEYS:
             self.ui_bridge.set_value(key, s.get(key, False))
 
     def _load_trigger(self, config: dict) -> None:
@@ -737,24 +958,17 @@ class MainWindow:
 
     def _load_overlay(self, config: dict) -> None:
         s = config["Overlay"]
-        checkboxes = (
-            "enable_box", "enable_skeleton", "draw_snaplines", "draw_bomb_timer",
-            "draw_health_numbers", "draw_armor", "draw_nicknames", "draw_weapon_names", "draw_teammates",
-            "draw_scoped", "draw_reloading", "draw_flashed", "draw_defusing", "draw_money",
-            "draw_distance", "draw_sniper_crosshair", "draw_spectators", "spectators_detailed", "spectators_self_only",
-        )
-        for key in checkboxes:
+        for key in _OVERLAY_FLAGS:
             self.ui_bridge.set_value(key, s.get(key, False))
 
-        for key, fmt in (("box_line_thickness", ".1f"), ("target_fps", ".0f")):
+        for key in ("box_line_thickness", "target_fps"):
             self.ui_bridge.set_value(key, s.get(key, 0))
 
-        for key in ("box_color_hex", "snaplines_color_hex", "text_color_hex", "weapon_color_hex", "teammate_color_hex"):
-            self.ui_bridge.set_value(key, s.get(key, "#FFFFFF").upper())
-            
-        self.ui_bridge.set_value("bomb_timer_position", s.get("bomb_timer_position", "Center-Left"))
-        self.ui_bridge.set_value("spectators_position", s.get("spectators_position", "Center-Right"))
-        self.ui_bridge.set_value("overlay_font", s.get("overlay_font", "Inter"))
+        for key, default in _OVERLAY_COLORS.items():
+            self.ui_bridge.set_value(key, s.get(key, default).upper())
+
+        for key, default in _OVERLAY_CHOICES.items():
+            self.ui_bridge.set_value(key, s.get(key, default))
 
     def _load_additional(self, config: dict) -> None:
         bh = config.get("Bunnyhop", {})
@@ -762,53 +976,34 @@ class MainWindow:
 
     def _validate_inputs(self) -> dict[str, str]:
         errors = {}
-        tk = self.ui_bridge.get_value("TriggerKey")
-        if tk is not None and not tk.strip():
-            errors["TriggerKey"] = "Trigger key cannot be empty."
-
-        min_delay = None
-        raw_min = self.ui_bridge.get_value("ShotDelayMin")
-        if raw_min is not None:
-            try:
-                min_delay = float(raw_min)
-                if min_delay < 0:
-                    errors["ShotDelayMin"] = "Must be non-negative."
-            except ValueError:
-                errors["ShotDelayMin"] = "Must be a valid number."
-
-        raw_max = self.ui_bridge.get_value("ShotDelayMax")
-        if raw_max is not None:
-            try:
-                max_delay = float(raw_max)
-                if max_delay < 0:
-                    errors["ShotDelayMax"] = "Must be non-negative."
-                elif min_delay is not None and min_delay > max_delay:
-                    errors["ShotDelayMax"] = "Cannot be less than minimum delay."
-            except ValueError:
-                errors["ShotDelayMax"] = "Must be a valid number."
-
-        raw_post = self.ui_bridge.get_value("PostShotDelay")
-        if raw_post is not None:
-            try:
-                post = float(raw_post)
-                if post < 0:
-                    errors["PostShotDelay"] = "Must be non-negative."
-            except ValueError:
-                errors["PostShotDelay"] = "Must be a valid number."
-
-        fps_val = self.ui_bridge.get_value("target_fps")
-        if fps_val is not None:
+        for key, message in _REQUIRED_TEXT:
+            val = self.ui_bridge.get_value(key)
+            if val is not None and not val.strip():
+                errors[key] = message
+
+        numbers: dict[str, float] = {}
+        for rule in _NUMERIC_RULES:
+            raw = self.ui_bridge.get_value(rule.key)
+            if raw is None:
+                continue
             try:
-                fps = float(fps_val)
-                if not (60 <= fps <= 420):
-                    errors["target_fps"] = "Must be between 60 and 420."
+                val = float(raw)
             except (ValueError, TypeError):
-                errors["target_fps"] = "Must be a valid number."
+                errors[rule.key] = "Must be a valid number."
+                continue
+            if val < rule.low or (rule.high is not None and val > rule.high):
+                errors[rule.key] = rule.message
+            else:
+                numbers[rule.key] = val
 
-        jk = self.ui_bridge.get_value("JumpKey")
-        if jk is not None and not jk.strip():
-            errors["JumpKey"] = "Jump key cannot be empty."
+        if (
+            "ShotDelayMin" in numbers and "ShotDelayMax" in numbers
+            and numbers["ShotDelayMin"] > numbers["ShotDelayMax"]
+        ):
+            errors["ShotDelayMax"] = "Cannot be less than minimum delay."
 
+        tk = self.ui_bridge.get_value("TriggerKey")
+        jk = self.ui_bridge.get_value("JumpKey")
         trigger_enabled = self.ui_bridge.get_value("Trigger")
         bunnyhop_enabled = self.ui_bridge.get_value("Bunnyhop")
         if (
@@ -863,8 +1058,8 @@ class MainWindow:
             for fd in self.features.values():
                 fd["instance"].update_config(merged)
             self.update_ui_from_config()
-            self.client_manager.apply_feature_state_changes(old_config, merged)
-            self.client_manager.update_running_feature_configs(merged)
+            started = self.client_manager.apply_feature_state_changes(old_config, merged)
+            self.client_manager.update_running_feature_configs(merged, skip=started)
             self.active_profile_name = name
             self.update_active_profile_label()
             logger.info("Loaded profile '%s'.", name)
@@ -902,6 +1097,11 @@ class MainWindow:
 
     def init_config_watcher(self) -> None:
         try:
+            # watchdog pulls in its platform observer machinery on import; keep it
+            # off the module import path so the window can be constructed first.
+            from watchdog.observers import Observer
+            from src.utils.file_watcher import ConfigFileChangeHandler
+
             handler = ConfigFileChangeHandler(self)
             self.observer = Observer()
             self.observer.schedule(handler, path=ConfigManager.CONFIG_DIRECTORY, recursive=False)
@@ -909,40 +1109,108 @@ class MainWindow:
             logger.info("Config file watcher started.")
         except Exception:
             logger.exception("Failed to start config file watcher.")
+            return
+
+        try:
+            from src.utils.file_watcher import LogFileChangeHandler
+
+            self.observer.schedule(LogFileChangeHandler(self), path=Logger.LOG_DIRECTORY(), recursive=False)
+            self._log_watch_active = True
+            logger.debug("Log file watcher started.")
+        except Exception:
+            logger.exception("Failed to start log file watcher; falling back to polling.")
 
     def start_log_timer(self) -> None:
+        """Tail the log now and keep polling it while the logs tab is showing.
+
+        With the watchdog log handler running, writes wake tail_log() directly and
+        this only catches events the OS dropped (Windows can defer change
+        notifications for files another handle holds open). The timer stops once
+        the tab is hidden; switch_view restarts it.
+        """
+        if self.log_timer is not None:
+            self.root.after_cancel(self.log_timer)
+            self.log_timer = None
+
         def _poll():
-            try:
-                if self.current_view == "logs":
-                    use_detailed = ConfigManager.get_value("General", "DetailedLogs", default=False)
-                    target = Logger.DETAILED_LOG_FILE() if use_detailed else Logger.LOG_FILE()
-
-                    if target != self._active_log_file:
-                        self._active_log_file = target
-                        self._log_file_pos = 0
-                        self.root.after(0, self._reload_log_display)
-                    elif hasattr(self, "log_text") and os.path.exists(target):
-                        with open(target, "r", encoding="utf-8") as fh:
-                            fh.seek(self._log_file_pos)
-                            new_bytes = fh.read()
-                            self._log_file_pos = fh.tell()
-                        if new_bytes:
-                            self.root.after(0, self.append_log_display, new_bytes)
-            except Exception:
-                logger.exception("Error reading log file for GUI display.")
-            self.log_timer = self.root.after(2000, _poll)
+            self.tail_log()
+            if self.current_view != "logs":
+                self.log_timer = None
+                return
+            interval = _LOG_SAFETY_POLL_MS if self._log_watch_active else _LOG_POLL_MS
+            self.log_timer = self.root.after(interval, _poll)
 
         _poll()
 
+    def tail_log(self) -> None:
+        """Append anything new in the active log file to the logs tab, if it is showing."""
+        try:
+            if self.current_view != "logs":
+                return
+            use_detailed = ConfigManager.get_value("General", "DetailedLogs", default=False)
+            target = Logger.DETAILED_LOG_FILE() if use_detailed else Logger.LOG_FILE()
+
+            # Already on the Tk thread (timer or coalesced watcher wake), and each
+            # call reads the whole pending delta, so render inline as one chunk.
+            if target != self._active_log_file:
+                self._active_log_file = target
+                self._log_file_pos = 0
+                self._reload_log_display()
+            elif self.log_text is not None:
+                new_text = self._read_log_delta(target)
+                if new_text:
+                    self.append_log_display(new_text)
+        except Exception:
+            logger.exception("Error reading log file for GUI display.")
+
+    def _read_log_delta(self, path: str) -> str:
+        """Return the text appended to path since _log_file_pos and advance the position.
+
+        The delta is sliced straight out of a read-only mmap so large logs skip the
+        intermediate read() buffer. Falls back to a plain seek+read when the file
+        cannot be mapped (empty file, Windows sharing violation mid-rotation).
+
+        An idle tick costs a single stat(): the file is only opened when its size
+        or mtime moved since the last read.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return ""
+        size = st.st_size
+        if st.st_mtime_ns == self._log_file_mtime_ns and size == self._log_file_pos:
+            return ""
+        self._log_file_mtime_ns = st.st_mtime_ns
+        if size < self._log_file_pos:
+            # File was truncated or rotated - start over from the top.
+            self._log_file_pos = 0
+        if size == self._log_file_pos:
+            return ""
+
+        # Opened per read on purpose: a handle held across ticks lacks
+        # FILE_SHARE_DELETE on Windows and would make RotatingFileHandler's
+        # rename fail. The stat gate above keeps idle ticks from opening it.
+        with open(path, "rb") as fh:
+            try:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    delta = mm[self._log_file_pos:size]
+            except (OSError, ValueError):
+                fh.seek(self._log_file_pos)
+                delta = fh.read(size - self._log_file_pos)
+
+        # Anything that moved the position (initial load, rotation, switching
+        # files) invalidates bytes the decoder is still holding back.
+        if self._log_decoder_pos != self._log_file_pos:
+            self._log_decoder.reset()
+        self._log_file_pos += len(delta)
+        self._log_decoder_pos = self._log_file_pos
+        return self._log_decoder.decode(delta)
+
     def _reload_log_display(self) -> None:
         """Flush the log widget and reload from the current active log file."""
         from src.gui.logs_tab import _initial_load
         _initial_load(self)
 
-    def update_log_display(self, content: str) -> None:
-        """Replace the entire log buffer and re-render. Kept for external callers."""
-        self._reset_log_buffer(content)
-
     def append_log_display(self, content: str) -> None:
         """Append new log text to the buffer and re-render."""
         self._append_to_log_buffer(content)
@@ -971,16 +1239,61 @@ class MainWindow:
         return entries
 
     def _reset_log_buffer(self, text: str) -> None:
-        """Replace the entire buffer and re-render the widget."""
-        self._log_lines = self._parse_log_entries(text)
+        """Replace the entire buffer and re-render the widget.
+
+        Capped like appends: a full log file can run to 10 MB, and inserting all
+        of it into the Text widget in one go stalls the Tk thread.
+        """
+        self._log_lines = self._parse_log_entries(text)[-_LOG_BUFFER_CAP:]
         self._apply_log_filter()
 
     def _append_to_log_buffer(self, text: str) -> None:
-        """Append new entries to the buffer (capped at 10 000) and re-render."""
-        self._log_lines.extend(self._parse_log_entries(text))
-        if len(self._log_lines) > 10_000:
-            self._log_lines = self._log_lines[-10_000:]
-        self._apply_log_filter()
+        """Append new entries to the buffer (capped at _LOG_BUFFER_CAP) and render only the delta."""
+        new_entries = self._parse_log_entries(text)
+        if not new_entries:
+            return
+        self._log_lines.extend(new_entries)
+        overflow = len(self._log_lines) - _LOG_BUFFER_CAP
+        dropped = self._log_lines[:overflow] if overflow > 0 else []
+        if dropped:
+            del self._log_lines[:overflow]
+        self._render_log_delta(new_entries, dropped)
+
+    @staticmethod
+    def _log_entry_visible(entry: str, level: str, term: str) -> bool:
+        return (level == "ALL" or f"[{level}]" in entry) and (not term or term in entry.lower())
+
+    def _render_log_delta(self, new_entries: list[str], dropped: list[str]) -> None:
+        """Insert newly arrived entries and trim evicted ones without re-rendering the rest.
+
+        Line positions come from the widget's own end index, so the existing text is
+        never read back or re-tagged.
+        """
+        if self.log_text is None or not self.log_text.winfo_exists():
+            return
+        level = self._log_filter_level
+        term  = self._log_search_term.lower().strip()
+
+        visible = [e for e in new_entries if self._log_entry_visible(e, level, term)]
+        drop_lines = sum(e.count("\n") for e in dropped if self._log_entry_visible(e, level, term))
+        if not visible and not drop_lines:
+            return
+
+        tb = self.log_text._textbox
+        try:
+            self.log_text.configure(state="normal")
+            if drop_lines:
+                tb.delete("1.0", f"{drop_lines + 1}.0")
+            if visible:
+                line, col = map(int, tb.index("end-1c").split("."))
+                tb.insert("end", "".join(visible))
+                self._apply_level_tags(visible, start_line=line, first_col=col)
+                if term:
+                    self._apply_search_tags(term, start=f"{line}.{col}")
+            self.log_text.see("end")
+            self.log_text.configure(state="disabled")
+        except Exception:
+            logger.exception("Failed to append to log view.")
 
     # Maps [LEVEL] token -> tag name registered in _create_log_body
     _LEVEL_TAG: dict[str, str] = {
@@ -993,16 +1306,12 @@ class MainWindow:
 
     def _apply_log_filter(self) -> None:
         """Render the log widget from the buffer with active level and search filters."""
-        if not hasattr(self, "log_text") or not self.log_text.winfo_exists():
+        if self.log_text is None or not self.log_text.winfo_exists():
             return
         level = self._log_filter_level
         term  = self._log_search_term.lower().strip()
 
-        visible = [
-            e for e in self._log_lines
-            if (level == "ALL" or f"[{level}]" in e)
-            and (not term or term in e.lower())
-        ]
+        visible = [e for e in self._log_lines if self._log_entry_visible(e, level, term)]
         content = "".join(visible)
 
         try:
@@ -1018,20 +1327,23 @@ class MainWindow:
         except Exception:
             logger.exception("Failed to render log view.")
 
-    def _apply_level_tags(self, entries: list[str]) -> None:
+    def _apply_level_tags(self, entries: list[str], start_line: int = 1, first_col: int = 0) -> None:
         """Color the [LEVEL] token in each entry after a bulk insert.
 
         Walks the entry list tracking the running character offset so we can
         derive exact tk.Text line/column positions without a second file scan.
         Each entry may span multiple lines (e.g. tracebacks); only the first
-        line carries the level tag.
+        line carries the level tag. A full render starts at 1.0 and clears old
+        tags; an append passes the insert position and leaves existing tags alone.
         """
         widget = self.log_text._textbox
-        # Remove stale level tags from the previous render in one pass each
-        for tag in self._LEVEL_TAG.values():
-            widget.tag_remove(tag, "1.0", "end")
+        if start_line == 1 and first_col == 0:
+            # Remove stale level tags from the previous render in one pass each
+            for tag in self._LEVEL_TAG.values():
+                widget.tag_remove(tag, "1.0", "end")
 
-        line_num = 1
+        line_num = start_line
+        col_offset = first_col
         for entry in entries:
             # Only the opening line of each entry has a [LEVEL] token
             first_line = entry.split("\n", 1)[0]
@@ -1040,16 +1352,21 @@ class MainWindow:
                 tag = self._LEVEL_TAG.get(m.group(1))
                 if tag:
                     # m.start()/end() are byte offsets into first_line - use as col indices
-                    start = f"{line_num}.{m.start()}"
-                    end   = f"{line_num}.{m.end()}"
+                    start = f"{line_num}.{m.start() + col_offset}"
+                    end   = f"{line_num}.{m.end() + col_offset}"
                     widget.tag_add(tag, start, end)
-            line_num += entry.count("\n")
+            newlines = entry.count("\n")
+            if newlines:
+                line_num += newlines
+                col_offset = 0
+            else:
+                col_offset += len(entry)
 
-    def _apply_search_tags(self, term: str) -> None:
-        """Highlight all occurrences of term with amber background in the widget."""
+    def _apply_search_tags(self, term: str, start: str = "1.0") -> None:
+        """Highlight occurrences of term from start onward with amber background."""
         widget = self.log_text._textbox
-        widget.tag_remove("search_hl", "1.0", "end")
-        start = "1.0"
+        if start == "1.0":
+            widget.tag_remove("search_hl", "1.0", "end")
         while True:
             pos = widget.search(term, start, nocase=True, stopindex="end")
             if not pos:
@@ -1109,7 +1426,7 @@ class MainWindow:
     def export_log_to_clipboard(self) -> None:
         """Copy the currently visible (filtered) log content to the clipboard."""
         try:
-            if not hasattr(self, "log_text") or not self.log_text.winfo_exists():
+            if self.log_text is None or not self.log_text.winfo_exists():
                 return
             content = self.log_text.get("1.0", "end-1c")
             self.root.clipboard_clear()
@@ -1122,6 +1439,8 @@ class MainWindow:
         self.root.mainloop()
 
     def on_closing(self) -> None:
+        self.flush_pending_save()
+        ConfigManager.flush_writes()
         self.cleanup()
         self.root.destroy()
 
@@ -1133,7 +1452,8 @@ class MainWindow:
             if self._fetch_patch_stop:
                 self._fetch_patch_stop.set()
 
-            self.stop_client()
+            # Join feature threads here: after cleanup the interpreter may exit.
+            self.stop_client(wait=True)
 
             if self.observer:
                 self.observer.stop()
@@ -1143,5 +1463,9 @@ class MainWindow:
                 self.root.after_cancel(self.log_timer)
             if self._process_monitor_timer:
                 self.root.after_cancel(self._process_monitor_timer)
+            if self._sysmon_executor:
+                self._sysmon_executor.shutdown(wait=False, cancel_futures=True)
+
+            self._release_private_fonts()
         except Exception:
             logger.exception("Error during application cleanup.")
\ No newline at end of file
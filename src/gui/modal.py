@@ -1,7 +1,6 @@
 import customtkinter as ctk
 
-from src.utils.utility import Utility
-from src.gui.icon_loader import ASSETS_DIR
+from src.gui.icon_loader import set_window_icon
 from src.gui.theme import (
     FONT_FAMILY_BOLD, FONT_FAMILY_REGULAR,
     FONT_SIZE_H4, FONT_SIZE_P,
@@ -59,7 +58,7 @@ class _AppModalDialog:
 
     def _apply_icon(self) -> None:
         try:
-            self._win.iconbitmap(Utility.resource_path(f"{ASSETS_DIR}/icon.ico"))
+            set_window_icon(self._win)
         except Exception:
             pass
 
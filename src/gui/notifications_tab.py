@@ -51,18 +51,52 @@ _TYPE_MAP = {
 
 _URL_REGEX = re.compile(r"(https?://[^\s<]+|\[(.+?)\]\((https?://[^\s<]+)\))")
 
+_NOTIFICATIONS_URL = "https://violetwing.vercel.app/data/notifications.json"
+
 
 def _get_read_notification_ids() -> set:
     """Retrieve the set of read notification IDs from configuration."""
-    config = ConfigManager.load_config()
-    return set(config.get("read_notifications", []))
+    return set(ConfigManager.get_value("read_notifications", default=[]))
 
 
 def _save_read_notification_ids(read_set: set) -> None:
     """Persist the set of read notification IDs to configuration."""
-    config = ConfigManager.load_config()
-    config["read_notifications"] = list(read_set)
-    ConfigManager.save_config(config, log_info=False)
+    ConfigManager.set_value("read_notifications", value=list(read_set))
+
+
+def _notification_id(notification: dict):
+    nid = notification.get("number")
+    return nid if nid is not None else notification.get("id")
+
+
+def _fetch_notifications() -> list:
+    """Download the notifications feed and keep only well-formed entries."""
+    response = Utility.get_http_session().get(_NOTIFICATIONS_URL, timeout=10)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    return [
+        n for n in data
+        if isinstance(n, dict) and ("number" in n or "id" in n) and "message" in n
+    ]
+
+
+def prefetch_notification_badge(main_window) -> None:
+    """Fetch the feed in the background to set the sidebar badge without building the tab."""
+    def _run():
+        try:
+            notifications = _fetch_notifications()
+        except Exception as exc:
+            logger.debug("Notification badge prefetch failed: %s", exc)
+            return
+        main_window._notifications_cache = notifications
+        read_set = _get_read_notification_ids()
+        unread = sum(1 for n in notifications if _notification_id(n) not in read_set)
+        try:
+            main_window.root.after(0, main_window.set_notification_badge, unread)
+        except Exception:
+            pass
+
+    threading.Thread(target=_run, daemon=True).start()
 
 
 def _resolve_type(notification: dict) -> tuple[str, dict]:
@@ -192,15 +226,10 @@ def populate_notifications(main_window, frame) -> None:
                 pass
 
         try:
-            session = Utility.get_http_session()
-            response = session.get('https://violetwing.vercel.app/data/notifications.json', timeout=10)
-            response.raise_for_status()
-            data = orjson.loads(response.content)
-
-            valid_notifications = [
-                n for n in data
-                if isinstance(n, dict) and ("number" in n or "id" in n) and "message" in n
-            ]
+            # Reuse the feed the startup badge prefetch already downloaded.
+            valid_notifications = main_window._notifications_cache
+            if valid_notifications is None:
+                valid_notifications = _fetch_notifications()
             if not valid_notifications:
                 safe_after(lambda: show_error(loading_card, "No valid notifications found"))
                 logger.warning("No valid notifications found in JSON data")
@@ -229,10 +258,7 @@ def populate_notifications(main_window, frame) -> None:
         read_set = _get_read_notification_ids()
 
         def sync_sidebar_badge():
-            unread_count = len([
-                n for n in notifications
-                if (n.get('number') if n.get('number') is not None else n.get('id')) not in read_set
-            ])
+            unread_count = sum(1 for n in notifications if _notification_id(n) not in read_set)
             if hasattr(main_window, "set_notification_badge"):
                 main_window.set_notification_badge(unread_count)
 
@@ -240,7 +266,7 @@ def populate_notifications(main_window, frame) -> None:
 
         def mark_all_read():
             for n in notifications:
-                nid = n.get('number') if n.get('number') is not None else n.get('id')
+                nid = _notification_id(n)
                 if nid is not None:
                     read_set.add(nid)
             _save_read_notification_ids(read_set)
@@ -281,7 +307,7 @@ def populate_notifications(main_window, frame) -> None:
             )
 
     def create_notification_card(container, notification, read_set, sync_sidebar_badge, is_last=False):
-        nid = notification.get('number') if notification.get('number') is not None else notification.get('id')
+        nid = _notification_id(notification)
         is_read = nid in read_set
         _, type_meta = _resolve_type(notification)
 
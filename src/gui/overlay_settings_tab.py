@@ -3,7 +3,10 @@ import customtkinter as ctk
 from src.gui.icon_loader import icon_label
 from src.utils.config_manager import COLOR_CHOICES
 from src.utils.utility import Utility
-from src.gui.components import create_section_frame, create_section_header, build_item_scaffold, create_scrollable_frame
+from src.gui.components import (
+    create_section_frame, create_section_header, build_item_scaffold, create_scrollable_frame,
+    numeric_entry_kwargs,
+)
 from src.gui.theme import (
     COLOR_BACKGROUND,
     CHECKBOX_STYLE, COMBOBOX_STYLE, ENTRY_STYLE, SLIDER_STYLE,
@@ -15,18 +18,45 @@ from src.gui.theme import (
 _HEX_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
 # Named presets + sentinel shown when the active color is not in the preset list.
 _COMBO_VALUES = list(COLOR_CHOICES.keys()) + ["Custom"]
+# Reverse of COLOR_CHOICES keyed by upper-case hex, for picker refreshes.
+_HEX_TO_NAME = {code.upper(): name for name, code in COLOR_CHOICES.items()}
+# Screen anchors offered by the bomb timer and spectator list.
+_POSITION_VALUES = ["Center-Left", "Center-Right", "Center-Top", "Center-Bottom"]
+_OVERLAY_FONTS = ["Inter", "JetBrainsMono", "Exo 2", "Rubik", "Roboto", "Open Sans", "Fira Code"]
+# Player-detail toggles, laid out row-major in a grid _PLAYER_INFO_COLUMNS wide.
+_PLAYER_INFO_FLAGS = (
+    ("draw_nicknames", "Nicknames"), ("draw_weapon_names", "Weapons"),
+    ("draw_health_numbers", "Health"), ("draw_flashed", "Flashed"),
+    ("draw_distance", "Distance"), ("draw_armor", "Armor"),
+    ("draw_scoped", "Scoped"), ("draw_reloading", "Reloading"),
+    ("draw_defusing", "Defusing"), ("draw_money", "Money"),
+)
+_PLAYER_INFO_COLUMNS = 5
 
 def populate_overlay_settings(main_window, frame):
     """Populate the Overlay Settings tab."""
     settings = create_scrollable_frame(frame, main_window)
 
     create_title_section(settings)
-
     _create_bounding_box_section(main_window, settings)
-    _create_snaplines_section(main_window, settings)
-    _create_player_info_section(main_window, settings)
-    _create_game_info_section(main_window, settings)
-    _create_colors_and_team_section(main_window, settings)
+
+    # The first section fills the viewport; the rest are built one per event-loop
+    # turn so the tab paints right away instead of after every section exists.
+    pending = [
+        _create_snaplines_section,
+        _create_player_info_section,
+        _create_game_info_section,
+        _create_colors_and_team_section,
+    ]
+
+    def _build_next():
+        if not settings.winfo_exists():
+            return
+        pending.pop(0)(main_window, settings)
+        if pending:
+            settings.after(1, _build_next)
+
+    settings.after(1, _build_next)
 
 def create_title_section(parent):
     title_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -73,17 +103,13 @@ def _create_player_info_section(main_window, parent):
     grid = ctk.CTkFrame(wf, fg_color="transparent")
     grid.pack(side="left", padx=(15, 0))
 
-    _make_checkbox(grid, "draw_nicknames",      main_window, text="Nicknames").grid(row=0, column=0, sticky="w", padx=(0, 20), pady=(0, 10))
-    _make_checkbox(grid, "draw_weapon_names",   main_window, text="Weapons").grid(row=0, column=1, sticky="w", padx=(0, 20), pady=(0, 10))
-    _make_checkbox(grid, "draw_health_numbers", main_window, text="Health").grid(row=0, column=2, sticky="w", padx=(0, 20), pady=(0, 10))
-    _make_checkbox(grid, "draw_flashed",        main_window, text="Flashed").grid(row=0, column=3, sticky="w", padx=(0, 20), pady=(0, 10))
-    _make_checkbox(grid, "draw_distance",       main_window, text="Distance").grid(row=0, column=4, sticky="w", pady=(0, 10))
-
-    _make_checkbox(grid, "draw_armor",          main_window, text="Armor").grid(row=1, column=0, sticky="w", padx=(0, 20))
-    _make_checkbox(grid, "draw_scoped",         main_window, text="Scoped").grid(row=1, column=1, sticky="w", padx=(0, 20))
-    _make_checkbox(grid, "draw_reloading",      main_window, text="Reloading").grid(row=1, column=2, sticky="w", padx=(0, 20))
-    _make_checkbox(grid, "draw_defusing",       main_window, text="Defusing").grid(row=1, column=3, sticky="w", padx=(0, 20))
-    _make_checkbox(grid, "draw_money",          main_window, text="Money").grid(row=1, column=4, sticky="w")
+    for i, (key, text) in enumerate(_PLAYER_INFO_FLAGS):
+        row, col = divmod(i, _PLAYER_INFO_COLUMNS)
+        _make_checkbox(grid, key, main_window, text=text).grid(
+            row=row, column=col, sticky="w",
+            padx=(0, 20) if col < _PLAYER_INFO_COLUMNS - 1 else 0,
+            pady=(0, 10) if row == 0 else 0,
+        )
 
 def _create_game_info_section(main_window, parent):
     section = create_section_frame(parent)
@@ -111,7 +137,7 @@ def _create_colors_and_team_section(main_window, parent):
     
     wf_font = build_item_scaffold(section, "Overlay Font", "")
     _make_combobox(wf_font, "overlay_font", main_window,
-                   override_values=["Inter", "JetBrainsMono", "Exo 2", "Rubik", "Roboto", "Open Sans", "Fira Code"],
+                   override_values=_OVERLAY_FONTS,
                    default_val="Inter").pack(side="left")
     
     wf_wpn = build_item_scaffold(section, "Weapon Text Color", "")
@@ -127,24 +153,25 @@ def _make_checkbox(parent, key, main_window, text=""):
     var = ctk.BooleanVar(value=main_window.overlay.config["Overlay"].get(key, False))
     cb = ctk.CTkCheckBox(
         parent, text=text, variable=var,
-        command=lambda: main_window.save_settings(show_message=False),
+        command=main_window.schedule_save,
         **CHECKBOX_STYLE,
     )
     main_window.ui_bridge.register(key, var=var)
     return cb
 
 def _make_combobox(parent, key, main_window, override_values=None, default_val=None):
+    overlay_cfg = main_window.overlay.config["Overlay"]
     if override_values is not None:
         values = override_values
-        default_val = main_window.overlay.config["Overlay"].get(key, default_val if default_val else values[0])
+        default_val = overlay_cfg.get(key, default_val if default_val else values[0])
     elif key in ("bomb_timer_position", "spectators_position"):
-        values = ["Center-Left", "Center-Right", "Center-Top", "Center-Bottom"]
-        default_val = main_window.overlay.config["Overlay"].get(key, "Center-Right" if key == "spectators_position" else "Center-Left")
+        values = _POSITION_VALUES
+        default_val = overlay_cfg.get(key, "Center-Right" if key == "spectators_position" else "Center-Left")
     else:
         values = ["Option 1", "Option 2"]
         default_val = values[0]
         
-    initial = main_window.overlay.config["Overlay"].get(key, default_val)
+    initial = overlay_cfg.get(key, default_val)
     var = ctk.StringVar(value=initial)
     
     combo = ctk.CTkComboBox(
@@ -159,17 +186,13 @@ def _make_combobox(parent, key, main_window, override_values=None, default_val=N
         dropdown_fg_color=COMBOBOX_STYLE["dropdown_fg_color"],
         dropdown_hover_color=COMBOBOX_STYLE["dropdown_hover_color"],
         dropdown_text_color=COMBOBOX_STYLE["dropdown_text_color"],
-        command=lambda _: main_window.save_settings(show_message=False)
+        command=main_window.on_widget_change,
     )
     combo.pack_configure = combo.pack
     main_window.ui_bridge.register(key, var=var)
     return combo
 
 def _make_slider(parent, key, main_window):
-    if key == "target_fps":
-        _make_fps_entry(parent, key, main_window)
-        return
-
     container = ctk.CTkFrame(parent, fg_color="transparent")
 
     value_frame = ctk.CTkFrame(container, corner_radius=8, fg_color=COLOR_BORDER,
@@ -185,8 +208,13 @@ def _make_slider(parent, key, main_window):
     value_label.pack(expand=True)
 
     def _on_change(val):
-        value_label.configure(text=f"{val:.1f}")
-        main_window.save_settings(show_message=False)
+        # CTkSlider calls back on every drag motion, even between steps. The label
+        # also tracks config reloads (via the bridge), so it is the last shown step.
+        text = f"{val:.1f}"
+        if text == value_label.cget("text"):
+            return
+        value_label.configure(text=text)
+        main_window.schedule_save()
 
     widget = ctk.CTkSlider(container, from_=0.5, to=5.0, number_of_steps=9,
                             command=_on_change, **SLIDER_STYLE)
@@ -220,6 +248,7 @@ def _make_fps_entry(parent, key, main_window):
         text_color=ENTRY_STYLE["text_color"],
         font=ENTRY_STYLE["font"],
         placeholder_text="144",
+        **numeric_entry_kwargs(container, integer=True),
     )
     entry.insert(0, str(initial))
     entry.pack(side="left")
@@ -244,7 +273,7 @@ def _make_fps_entry(parent, key, main_window):
             return
         entry.delete(0, "end")
         entry.insert(0, str(val))
-        main_window.save_settings(show_message=False)
+        main_window.schedule_save()
 
     entry.bind("<FocusOut>", _commit)
     entry.bind("<Return>",   _commit)
@@ -259,11 +288,7 @@ def _make_fps_entry(parent, key, main_window):
 
 def _hex_to_combo_name(hex_val: str) -> str:
     """Return the named preset label for a hex value, or 'Custom' if not in the list."""
-    normalized = hex_val.upper()
-    for name, code in COLOR_CHOICES.items():
-        if code.upper() == normalized:
-            return name
-    return "Custom"
+    return _HEX_TO_NAME.get(hex_val.upper(), "Custom")
 
 def _make_color_picker(parent, key, main_window):
     """Composite color picker: live swatch + named-preset combo + free hex entry.
@@ -327,7 +352,7 @@ def _make_color_picker(parent, key, main_window):
         entry.insert(0, hex_val)
         combo_var.set(_hex_to_combo_name(hex_val))
         if save:
-            main_window.save_settings(show_message=False)
+            main_window.schedule_save()
 
     def _on_combo_select(_event=None) -> None:
         name = combo_var.get()
@@ -2,7 +2,7 @@ import io
 import threading
 import requests
 import orjson
-from PIL import Image, ImageDraw
+from PIL import Image
 import customtkinter as ctk
 
 from src.utils.logger import Logger
@@ -21,6 +21,10 @@ logger = Logger.get_logger(__name__)
 # Global memory cache for loaded Vercel server avatar images
 _AVATAR_CACHE: dict[str, ctk.CTkImage] = {}
 
+# Avatars are drawn at 36x36; keep 2x that for high-DPI scaling and drop the rest.
+_AVATAR_SIZE = (36, 36)
+_AVATAR_SOURCE_PX = (72, 72)
+
 
 def _load_user_avatar(username: str, main_window, callback) -> None:
     """Asynchronously fetch avatar image from VioletWing Vercel server."""
@@ -40,7 +44,10 @@ def _load_user_avatar(username: str, main_window, callback) -> None:
                 resp = session.get(url, timeout=4)
                 if resp.status_code == 200 and resp.content:
                     raw_img = Image.open(io.BytesIO(resp.content)).convert("RGBA")
-                    ctk_img = ctk.CTkImage(light_image=raw_img, dark_image=raw_img, size=(36, 36))
+                    # Shrink here on the worker so CTkImage's per-scaling resize on
+                    # the Tk thread starts from a small image, not the full upload.
+                    raw_img.thumbnail(_AVATAR_SOURCE_PX, Image.LANCZOS)
+                    ctk_img = ctk.CTkImage(light_image=raw_img, dark_image=raw_img, size=_AVATAR_SIZE)
                     _AVATAR_CACHE[username] = ctk_img
 
                     def _safe_cb():
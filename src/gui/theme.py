@@ -2,6 +2,8 @@
 Centralized theme for the application's UI.
 """
 
+from types import MappingProxyType
+
 # Font families
 FONT_FAMILY_BOLD = ("Outfit", 0, "bold")
 FONT_FAMILY_REGULAR = ("JetBrainsMono", 0)
@@ -72,26 +74,27 @@ FONT_DROPDOWN =            (FONT_FAMILY_REGULAR[0], FONT_SIZE_P)
 FONT_TABULAR =             (FONT_FAMILY_REGULAR[0], FONT_SIZE_H4, "bold")
 
 # Component Styles
-SECTION_STYLE = {
+# Read-only so a call site can't mutate a style every other widget shares.
+SECTION_STYLE = MappingProxyType({
     "corner_radius": 24,
     "fg_color": COLOR_BACKGROUND,
     "border_width": 0,
-}
+})
 
-SECTION_STYLE_DANGER = {
+SECTION_STYLE_DANGER = MappingProxyType({
     "corner_radius": 24,
     "fg_color": COLOR_BACKGROUND,
     "border_width": 2,
     "border_color": COLOR_BUTTON_DANGER_BORDER
-}
+})
 
-SETTING_ITEM_STYLE = {
+SETTING_ITEM_STYLE = MappingProxyType({
     "corner_radius": 16,
     "fg_color": COLOR_WIDGET_BACKGROUND,
     "border_width": 0,
-}
+})
 
-CHECKBOX_STYLE = {
+CHECKBOX_STYLE = MappingProxyType({
     "width": 30,
     "height": 30,
     "corner_radius": 6,
@@ -99,9 +102,9 @@ CHECKBOX_STYLE = {
     "fg_color": COLOR_ACCENT_FG,
     "hover_color": COLOR_ACCENT_HOVER,
     "checkmark_color": "#ffffff",
-}
+})
 
-ENTRY_STYLE = {
+ENTRY_STYLE = MappingProxyType({
     "width": 220,
     "height": 45,
     "corner_radius": 8,
@@ -110,9 +113,9 @@ ENTRY_STYLE = {
     "fg_color": COLOR_WIDGET_FG,
     "text_color": COLOR_TEXT_PRIMARY,
     "font": FONT_WIDGET,
-}
+})
 
-SLIDER_STYLE = {
+SLIDER_STYLE = MappingProxyType({
     "width": 200,
     "height": 20,
     "corner_radius": 8,
@@ -122,9 +125,9 @@ SLIDER_STYLE = {
     "progress_color": COLOR_ACCENT_FG,
     "button_color": COLOR_SLIDER_BUTTON,
     "button_hover_color": COLOR_SLIDER_BUTTON_HOVER,
-}
+})
 
-COMBOBOX_STYLE = {
+COMBOBOX_STYLE = MappingProxyType({
     "width": 180,
     "height": 45,
     "corner_radius": 8,
@@ -137,9 +140,9 @@ COMBOBOX_STYLE = {
     "dropdown_fg_color": COLOR_BACKGROUND,
     "dropdown_hover_color": COLOR_DROPDOWN_HOVER,
     "dropdown_text_color": COLOR_TEXT_PRIMARY,
-}
+})
 
-BUTTON_STYLE_PRIMARY = {
+BUTTON_STYLE_PRIMARY = MappingProxyType({
     "font": (FONT_FAMILY_BOLD[0], FONT_SIZE_H3, FONT_FAMILY_BOLD[2]),
     "corner_radius": 8,
     "fg_color": COLOR_BUTTON_PRIMARY_FG,
@@ -148,9 +151,9 @@ BUTTON_STYLE_PRIMARY = {
     "border_color": COLOR_BUTTON_PRIMARY_BORDER,
     "text_color": COLOR_BUTTON_PRIMARY_TEXT,
     "height": 48
-}
+})
 
-BUTTON_STYLE_DANGER = {
+BUTTON_STYLE_DANGER = MappingProxyType({
     "font": (FONT_FAMILY_BOLD[0], FONT_SIZE_H3, FONT_FAMILY_BOLD[2]),
     "corner_radius": 8,
     "fg_color": COLOR_BUTTON_DANGER_FG,
@@ -159,4 +162,4 @@ BUTTON_STYLE_DANGER = {
     "border_color": COLOR_BUTTON_DANGER_BORDER,
     "text_color": COLOR_BUTTON_DANGER_TEXT,
     "height": 48
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -1,6 +1,9 @@
 import customtkinter as ctk
 from src.gui.icon_loader import icon_label
-from src.gui.components import create_section_frame, create_section_header, build_item_scaffold, create_scrollable_frame
+from src.gui.components import (
+    create_section_frame, create_section_header, build_item_scaffold, create_scrollable_frame,
+    numeric_entry_kwargs,
+)
 from src.gui.keybind_recorder import KeybindRecorder
 from src.gui.theme import (
     COLOR_BACKGROUND,
@@ -10,6 +13,9 @@ from src.gui.theme import (
 
 WEAPON_TYPES = ["Pistols", "Rifles", "Snipers", "SMGs", "Heavy"]
 
+# Narrow variant of the shared entry style for the three delay columns.
+_DELAY_ENTRY_STYLE = {**ENTRY_STYLE, "width": 70}
+
 def populate_trigger_settings(main_window, frame):
     """Populate the settings frame with configuration options."""
     main_window.trigger_settings_frame = frame
@@ -18,7 +24,14 @@ def populate_trigger_settings(main_window, frame):
     
     create_title_section(settings)
     create_trigger_config_section(main_window, settings)
-    create_timing_settings_section(main_window, settings)
+
+    # Timing sits below the fold; build it on the next event-loop turn so the
+    # tab paints first, as the overlay tab does for its later sections.
+    def _build_timing():
+        if settings.winfo_exists():
+            create_timing_settings_section(main_window, settings)
+
+    settings.after(1, _build_timing)
 
 def create_title_section(parent):
     """Create the title and subtitle for the settings page."""
@@ -48,21 +61,22 @@ def create_trigger_config_section(main_window, parent):
                           icon_file="bullseye_icon.png")
 
     wf = build_item_scaffold(section, "Behavior", "Trigger key and behavior toggles", is_last=True)
-    
+    trigger_cfg = main_window.triggerbot.config["Trigger"]
+
     # Keybind on the left
-    initial = main_window.triggerbot.config["Trigger"].get("TriggerKey", "")
+    initial = trigger_cfg.get("TriggerKey", "")
     key_var = ctk.StringVar(value=initial)
-    recorder = KeybindRecorder(wf, var=key_var, on_capture=main_window.save_settings)
+    recorder = KeybindRecorder(wf, var=key_var, on_capture=main_window.schedule_save)
     recorder.pack(side="left", padx=(0, 20))
     main_window.ui_bridge.register("TriggerKey", var=key_var)
 
     # Checkboxes to the right
-    toggle_var = ctk.BooleanVar(value=main_window.triggerbot.config["Trigger"].get("ToggleMode", False))
-    ctk.CTkCheckBox(wf, text="Toggle Mode", variable=toggle_var, command=main_window.save_settings, **CHECKBOX_STYLE).pack(side="left", padx=(0, 20))
+    toggle_var = ctk.BooleanVar(value=trigger_cfg.get("ToggleMode", False))
+    ctk.CTkCheckBox(wf, text="Toggle Mode", variable=toggle_var, command=main_window.schedule_save, **CHECKBOX_STYLE).pack(side="left", padx=(0, 20))
     main_window.ui_bridge.register("ToggleMode", var=toggle_var)
 
-    team_var = ctk.BooleanVar(value=main_window.triggerbot.config["Trigger"].get("AttackOnTeammates", False))
-    ctk.CTkCheckBox(wf, text="Attack Teammates", variable=team_var, command=main_window.save_settings, **CHECKBOX_STYLE).pack(side="left")
+    team_var = ctk.BooleanVar(value=trigger_cfg.get("AttackOnTeammates", False))
+    ctk.CTkCheckBox(wf, text="Attack Teammates", variable=team_var, command=main_window.schedule_save, **CHECKBOX_STYLE).pack(side="left")
     main_window.ui_bridge.register("AttackOnTeammates", var=team_var)
 
 def create_timing_settings_section(main_window, parent):
@@ -73,9 +87,8 @@ def create_timing_settings_section(main_window, parent):
 
     wf = build_item_scaffold(section, "Delays", "Delay thresholds in seconds", is_last=True)
 
-    active_weapon_var = ctk.StringVar(
-        value=main_window.triggerbot.config["Trigger"].get("active_weapon_type", "Rifles")
-    )
+    trigger_cfg = main_window.triggerbot.config["Trigger"]
+    active_weapon_var = ctk.StringVar(value=trigger_cfg.get("active_weapon_type", "Rifles"))
     main_window.ui_bridge.register("active_weapon_type", var=active_weapon_var)
     
     combo_col = ctk.CTkFrame(wf, fg_color="transparent")
@@ -90,21 +103,25 @@ def create_timing_settings_section(main_window, parent):
         **COMBOBOX_STYLE,
     ).pack()
 
+    # Seed the columns from the active weapon here; going through
+    # update_weapon_settings_display would set each entry twice and flash it.
+    weapon_cfg = trigger_cfg.get("WeaponSettings", {}).get(active_weapon_var.get(), {})
+
     def _make_delay_column(parent, title, key, default_val):
         col = ctk.CTkFrame(parent, fg_color="transparent")
         ctk.CTkLabel(col, text=title, text_color=COLOR_TEXT_PRIMARY).pack(pady=(0, 4))
         
-        widget = ctk.CTkEntry(col, justify="center", **{**ENTRY_STYLE, "width": 70})
-        widget.bind("<FocusOut>", lambda e: main_window.save_settings())
-        widget.bind("<Return>",   lambda e: main_window.save_settings())
-        widget.insert(0, str(default_val))
+        # Bound to a StringVar so switching weapon type is one var.set() instead of delete+insert.
+        var = ctk.StringVar(value=str(weapon_cfg.get(key, default_val)))
+        widget = ctk.CTkEntry(col, textvariable=var, justify="center",
+                              **_DELAY_ENTRY_STYLE, **numeric_entry_kwargs(col))
+        widget.bind("<FocusOut>", main_window.on_widget_change)
+        widget.bind("<Return>",   main_window.on_widget_change)
         widget.pack()
         
-        main_window.ui_bridge.register(key, widget=widget)
+        main_window.ui_bridge.register(key, widget=widget, var=var)
         return col
 
     _make_delay_column(wf, "Min Delay", "ShotDelayMin", 0.01).pack(side="left", padx=(0, 15))
     _make_delay_column(wf, "Max Delay", "ShotDelayMax", 0.03).pack(side="left", padx=(0, 15))
-    _make_delay_column(wf, "Post Delay", "PostShotDelay", 0.1).pack(side="left")
-
-    main_window.update_weapon_settings_display()
\ No newline at end of file
+    _make_delay_column(wf, "Post Delay", "PostShotDelay", 0.1).pack(side="left")
\ No newline at end of file
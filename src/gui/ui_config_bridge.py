@@ -4,8 +4,10 @@ from contextlib import contextmanager
 
 class UIConfigBridge:
     def __init__(self) -> None:
-        # key → {"widget": w, "var": v, "value_label": lbl, "fmt": fmt_str}
+        # key → {"widget": w, "var": v, "value_label": lbl, "fmt": fmt_str, "get": getter}
         self._registry: dict[str, dict] = {}
+        # Keys currently showing an inline error; clear_errors only visits these.
+        self._error_keys: set[str] = set()
         self._batching: bool = False
         self._batch_queue: dict[str, tuple] = {}
 
@@ -31,12 +33,15 @@ class UIConfigBridge:
                          the var/widget, so composite widgets (e.g. color picker with
                          swatch + entry + combo) can stay in sync.
         """
+        # Resolve the read path once so get_value is a single call per save.
+        source = var if var is not None else widget
         self._registry[key] = {
             "widget": widget,
             "var": var,
             "value_label": value_label,
             "fmt": fmt,
             "refresh_cb": refresh_cb,
+            "get": source.get if source is not None else None,
         }
 
     def get_value(self, key: str) -> Any:
@@ -46,23 +51,30 @@ class UIConfigBridge:
         Returns None for unregistered keys so callers can skip gracefully.
         """
         entry = self._registry.get(key)
-        if entry is None:
+        if entry is None or entry["get"] is None:
             return None
-        if entry["var"] is not None:
-            return entry["var"].get()
-        if entry["widget"] is not None:
-            return entry["widget"].get()
-        return None
+        return entry["get"]()
 
     def set_value(self, key: str, value: Any) -> None:
         """Push a config value into the UI widget for the given key.
 
         Silently ignores unregistered keys so partial tab population works.
+        Values the widget already shows are skipped: a var.set() fires its
+        traces and a widget redraw even when nothing changed, and most keys
+        are unchanged on a reload.
         """
         entry = self._registry.get(key)
         if entry is None:
             return
 
+        if entry["get"] is not None:
+            try:
+                current = entry["get"]()
+            except Exception:
+                current = None  # e.g. a numeric var holding unparsable text
+            if current == value or (isinstance(current, str) and current == str(value)):
+                return
+
         var = entry["var"]
         widget = entry["widget"]
         label = entry["value_label"]
@@ -129,6 +141,7 @@ class UIConfigBridge:
             return
         widget = entry.get("widget")
         if widget is not None and hasattr(widget, "configure"):
+            self._error_keys.add(key)
             try:
                 # Save original border color if not already saved
                 if not hasattr(widget, "_orig_border_color"):
@@ -152,8 +165,9 @@ class UIConfigBridge:
 
     def clear_errors(self) -> None:
         """Clear all validation errors from the UI."""
-        for entry in self._registry.values():
-            widget = entry.get("widget")
+        for key in self._error_keys:
+            entry = self._registry.get(key)
+            widget = entry.get("widget") if entry is not None else None
             if widget is not None:
                 try:
                     if hasattr(widget, "_orig_border_color"):
@@ -162,3 +176,4 @@ class UIConfigBridge:
                         widget._error_label.pack_forget()
                 except Exception:
                     pass
+        self._error_keys.clear()
@@ -1,7 +1,9 @@
+import copy
+import math
 import os
 import platform
+import tempfile
 import orjson
-import copy
 from pathlib import Path
 from typing import Dict, Any, Optional
 import threading
@@ -12,6 +14,34 @@ import src.utils.error_codes as EC
 # Initialize the logger for consistent logging
 logger = Logger.get_logger(__name__)
 
+def _is_json_safe(value: Any) -> bool:
+    """True if value survives an orjson round-trip unchanged.
+
+    Only exact dict/list/str/bool/None, 64-bit ints and finite floats qualify;
+    tuples, subclasses, non-str keys and NaN/inf would come back altered.
+    """
+    kind = type(value)
+    if kind is dict:
+        return all(type(k) is str and _is_json_safe(v) for k, v in value.items())
+    if kind is list:
+        return all(_is_json_safe(v) for v in value)
+    if kind is float:
+        return math.isfinite(value)
+    if kind is int:
+        return -(2 ** 63) <= value < 2 ** 64
+    return kind is str or kind is bool or value is None
+
+def _clone(config: Any) -> Any:
+    """Deep-copy a config.
+
+    An orjson round-trip is several times faster than copy.deepcopy for plain
+    dict/list/str/number trees, so it is used whenever the value is JSON-safe;
+    anything else falls back to copy.deepcopy so the copy is always faithful.
+    """
+    if _is_json_safe(config):
+        return orjson.loads(orjson.dumps(config))
+    return copy.deepcopy(config)
+
 class ConfigManager:
     """Thread-safe configuration manager for the application."""
 
@@ -27,6 +57,9 @@ class ConfigManager:
     )
     CONFIG_DIRECTORY  = str(_BASE)
     UPDATE_DIRECTORY  = str(_BASE / "Update")
+    # Kept out of CONFIG_DIRECTORY itself, which the config watcher observes
+    # (non-recursively), so cache refreshes never wake it.
+    CACHE_DIRECTORY   = str(_BASE / "Cache")
     CONFIG_FILE       = _BASE / "config.json"
     
     # Default configuration settings
@@ -98,6 +131,16 @@ class ConfigManager:
     # Cache and thread safety - RLock allows set_value to re-enter load_config
     _config_cache: Optional[Dict[str, Any]] = None
     _lock: threading.RLock = threading.RLock()
+    # mtime of the file this process last wrote; lets the watcher ignore its own saves
+    _last_saved_mtime_ns: Optional[int] = None
+    # Background writer for save_config_async: at most one pending snapshot,
+    # newest wins. _write_lock serializes every write to config.json; it is
+    # re-entrant so callers can hold it across a write they need to be atomic.
+    _write_lock: threading.RLock = threading.RLock()
+    _write_cond: threading.Condition = threading.Condition()
+    _pending_write: Optional[Dict[str, Any]] = None
+    _writing: bool = False
+    _writer: Optional[threading.Thread] = None
 
     @classmethod
     def load_config(cls) -> Dict[str, Any]:
@@ -114,12 +157,12 @@ class ConfigManager:
         """
         # Fast path: return cached config if available (no lock needed for read)
         if cls._config_cache is not None:
-            return copy.deepcopy(cls._config_cache)
+            return _clone(cls._config_cache)
 
         with cls._lock:
             # Double-check pattern: another thread might have loaded it
             if cls._config_cache is not None:
-                return copy.deepcopy(cls._config_cache)
+                return _clone(cls._config_cache)
             
             # Ensure directories exist
             cls._ensure_directories()
@@ -130,7 +173,7 @@ class ConfigManager:
             else:
                 cls._load_existing_config()
 
-            return copy.deepcopy(cls._config_cache)
+            return _clone(cls._config_cache)
 
     @classmethod
     def _ensure_directories(cls) -> None:
@@ -144,7 +187,7 @@ class ConfigManager:
     def _create_default_config(cls) -> None:
         """Create a new configuration file with default settings."""
         logger.info("config.json not found at %s, creating default.", cls.CONFIG_FILE)
-        default_copy = copy.deepcopy(cls.DEFAULT_CONFIG)
+        default_copy = _clone(cls.DEFAULT_CONFIG)
         cls._config_cache = default_copy
         cls._save_to_file(default_copy, log_info=False)
 
@@ -164,7 +207,7 @@ class ConfigManager:
                 cls._save_to_file(cls._config_cache, log_info=False)
         except (orjson.JSONDecodeError, IOError, ValueError) as e:
             Logger.error_code(EC.E1002, "%s", e)
-            default_copy = copy.deepcopy(cls.DEFAULT_CONFIG)
+            default_copy = _clone(cls.DEFAULT_CONFIG)
             cls._config_cache = default_copy
             cls._save_to_file(default_copy, log_info=False)
 
@@ -183,7 +226,7 @@ class ConfigManager:
         updated = False
         for key, value in default.items():
             if key not in current:
-                current[key] = copy.deepcopy(value)
+                current[key] = _clone(value)
                 updated = True
                 logger.debug("Added missing config key: %s", key)
             elif isinstance(value, dict) and isinstance(current.get(key), dict):
@@ -205,21 +248,103 @@ class ConfigManager:
         """
         with cls._lock:
             # Update cache
-            cls._config_cache = copy.deepcopy(config)
-            # Save to file
+            cls._config_cache = _clone(config)
+            return cls._write_superseding(config, log_info)
+
+    @classmethod
+    def save_config_async(cls, config: Dict[str, Any]) -> None:
+        """
+        Update the cache now and write the file on a background thread.
+
+        Keeps disk I/O off the caller (the Tk thread). Snapshots queued faster
+        than the disk can take them collapse into one write of the newest.
+        Call flush_writes() before exit so the last snapshot reaches disk.
+        """
+        snapshot = _clone(config)
+        with cls._lock:
+            cls._config_cache = snapshot
+        with cls._write_cond:
+            cls._pending_write = snapshot
+            if cls._writer is None or not cls._writer.is_alive():
+                cls._writer = threading.Thread(
+                    target=cls._write_loop, name="ConfigWriter", daemon=True,
+                )
+                cls._writer.start()
+            cls._write_cond.notify_all()
+
+    @classmethod
+    def _write_superseding(cls, config: Dict[str, Any], log_info: bool) -> bool:
+        """Write config synchronously, dropping any older queued snapshot.
+
+        Callers hold _lock, so any queued snapshot predates config. Clearing it
+        and writing under one _write_lock hold means the background writer can
+        never publish that snapshot after this write.
+        """
+        with cls._write_lock:
+            with cls._write_cond:
+                cls._pending_write = None
+                cls._write_cond.notify_all()
             return cls._save_to_file(config, log_info)
 
+    @classmethod
+    def _write_loop(cls) -> None:
+        while True:
+            with cls._write_cond:
+                cls._write_cond.wait_for(lambda: cls._pending_write is not None)
+            # Take the snapshot only once _write_lock is held: a synchronous write
+            # that got in first has already superseded (and cleared) it.
+            with cls._write_lock:
+                with cls._write_cond:
+                    config, cls._pending_write = cls._pending_write, None
+                    cls._writing = config is not None
+                if config is None:
+                    continue
+                try:
+                    cls._save_to_file(config, log_info=False)
+                finally:
+                    with cls._write_cond:
+                        cls._writing = False
+                        cls._write_cond.notify_all()
+
+    @classmethod
+    def flush_writes(cls, timeout: float = 2.0) -> bool:
+        """Wait for queued background writes; return False if timeout expired first."""
+        with cls._write_cond:
+            return cls._write_cond.wait_for(
+                lambda: cls._pending_write is None and not cls._writing, timeout,
+            )
+
     @classmethod
     def _save_to_file(cls, config: Dict[str, Any], log_info: bool = True) -> bool:
-        try:
-            Path(cls.CONFIG_DIRECTORY).mkdir(parents=True, exist_ok=True)
-            cls.CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
-            if log_info:
-                logger.info("Saved configuration to %s.", cls.CONFIG_FILE)
-            return True
-        except (OSError, IOError) as e:
-            Logger.error_code(EC.E1003, "%s", e)
-            return False
+        """Serialize config to a sibling temp file and atomically swap it into place.
+
+        os.replace guarantees readers (the file watcher, a second instance, a crash
+        mid-write) only ever see the old or the new file, never a torn one. Every
+        write takes _write_lock and gets its own temp file, so the background
+        writer and a reload-time migration on the watcher thread never collide.
+        """
+        tmp_name = None
+        with cls._write_lock:
+            try:
+                Path(cls.CONFIG_DIRECTORY).mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    dir=cls.CONFIG_DIRECTORY, prefix="config.", suffix=".json.tmp", delete=False,
+                ) as tmp:
+                    tmp_name = tmp.name
+                    tmp.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_name, cls.CONFIG_FILE)
+                cls._last_saved_mtime_ns = cls.CONFIG_FILE.stat().st_mtime_ns
+                if log_info:
+                    logger.info("Saved configuration to %s.", cls.CONFIG_FILE)
+                return True
+            except (OSError, IOError) as e:
+                Logger.error_code(EC.E1003, "%s", e)
+                if tmp_name is not None:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
+                return False
 
     @classmethod
     def reset_to_default(cls) -> Dict[str, Any]:
@@ -230,11 +355,34 @@ class ConfigManager:
             The default configuration dictionary
         """
         with cls._lock:
-            default_copy = copy.deepcopy(cls.DEFAULT_CONFIG)
+            default_copy = _clone(cls.DEFAULT_CONFIG)
             cls._config_cache = default_copy
-            cls._save_to_file(default_copy, log_info=True)
+            cls._write_superseding(default_copy, log_info=True)
             logger.info("Configuration reset to default values.")
-            return copy.deepcopy(default_copy)
+            return _clone(default_copy)
+
+    @classmethod
+    def file_matches_last_save(cls) -> bool:
+        """Return True if config.json on disk is still the file this process last wrote."""
+        if cls._last_saved_mtime_ns is None:
+            return False
+        try:
+            return cls.CONFIG_FILE.stat().st_mtime_ns == cls._last_saved_mtime_ns
+        except OSError:
+            return False
+
+    @classmethod
+    def reload(cls) -> bool:
+        """Re-read config.json into the cache; return True if its contents changed."""
+        with cls._lock:
+            previous = cls._config_cache
+            cls._config_cache = None
+            cls._ensure_directories()
+            if not cls.CONFIG_FILE.exists():
+                cls._create_default_config()
+            else:
+                cls._load_existing_config()
+            return cls._config_cache != previous
 
     @classmethod
     def invalidate_cache(cls) -> None:
@@ -295,7 +443,10 @@ class ConfigManager:
                     current[key] = {}
                 current = current[key]
             current[keys[-1]] = value
-            return cls._save_to_file(config, log_info=False)
+            # config is already a private clone; adopt it as the cache without
+            # another copy so get_value() sees the write.
+            cls._config_cache = config
+            return cls._write_superseding(config, log_info=False)
 
 # Color choices for Overlay
 COLOR_CHOICES = {
@@ -1,5 +1,6 @@
 import os
 import threading
+import time
 from watchdog.events import FileSystemEventHandler
 
 from src.utils.config_manager import ConfigManager
@@ -25,22 +26,71 @@ class ConfigFileChangeHandler(FileSystemEventHandler):
         self.main_window = main_window
         self.debounce_interval = debounce_interval
         self.debounce_timer = None
+        self._deadline = 0.0
+        self._timer_lock = threading.Lock()
         self.config_path = ConfigManager.CONFIG_FILE
+        self._config_key = self._normalize(self.config_path)
+
+    @staticmethod
+    def _normalize(path) -> str:
+        return os.path.normcase(os.path.abspath(os.fsdecode(path)))
 
     def on_modified(self, event):
         """Called when a file or directory is modified."""
+        self._schedule_reload(event.src_path)
+
+    def on_created(self, event):
+        """Called when the config file is recreated (delete + write editors)."""
+        self._schedule_reload(event.src_path)
+
+    def on_moved(self, event):
+        """Called when a temp file is renamed over the config (atomic saves)."""
+        self._schedule_reload(getattr(event, "dest_path", None))
+
+    def _schedule_reload(self, path):
+        """Push the reload deadline back if path is the config file.
+
+        Editors emit several events per save (truncate, write, rename); only the
+        trailing one, debounce_interval after the burst ends, triggers a reload.
+        A burst only moves the deadline; one timer thread serves the whole burst.
+        """
         if getattr(self.main_window, "_suppress_watcher", False):
             return
-        if event.src_path and os.path.exists(self.config_path) and os.path.samefile(event.src_path, self.config_path):
-            if self.debounce_timer is not None:
-                self.debounce_timer.cancel()
-            self.debounce_timer = threading.Timer(self.debounce_interval, self.reload_config)
-            self.debounce_timer.start()
+        if not path or self._normalize(path) != self._config_key:
+            return
+        with self._timer_lock:
+            self._deadline = time.monotonic() + self.debounce_interval
+            if self.debounce_timer is None:
+                self._arm(self.debounce_interval)
+
+    def _arm(self, delay):
+        self.debounce_timer = threading.Timer(delay, self._on_debounce)
+        self.debounce_timer.daemon = True
+        self.debounce_timer.start()
+
+    def _on_debounce(self):
+        with self._timer_lock:
+            remaining = self._deadline - time.monotonic()
+            if remaining > 0:
+                self._arm(remaining)
+                return
+            self.debounce_timer = None
+        self.reload_config()
 
     def reload_config(self):
         """Reloads the configuration file and updates all feature configurations."""
         try:
-            ConfigManager.invalidate_cache()
+            # Our own saves land here too once the debounce fires; skip them so a
+            # save never bounces back as a reload + full UI refresh.
+            if ConfigManager.file_matches_last_save():
+                logger.debug("Config change matches our last save; skipping reload.")
+                return
+
+            # Metadata-only events (touch, AV scans, editor swap files) leave the
+            # content as-is; don't push an identical config through every widget.
+            if not ConfigManager.reload():
+                logger.debug("Config file touched but unchanged; skipping reload.")
+                return
             new_config = ConfigManager.load_config()
 
             # update_config() triggers internal cache resets (e.g. weapon settings,
@@ -48,6 +98,44 @@ class ConfigFileChangeHandler(FileSystemEventHandler):
             for feature_data in self.main_window.features.values():
                 feature_data["instance"].update_config(new_config)
 
-            self.main_window.root.after(0, self.main_window.update_ui_from_config)
+            self.main_window.root.after(0, self.main_window.schedule_ui_refresh)
         except Exception as e:
-            logger.exception("Failed to reload configuration from %s: %s", self.config_path, e)
\ No newline at end of file
+            logger.exception("Failed to reload configuration from %s: %s", self.config_path, e)
+
+class LogFileChangeHandler(FileSystemEventHandler):
+    """
+    Wakes the logs tab when either log file is written, instead of relying on a
+    fast poll. Bursts of events are coalesced into one tail on the Tk thread.
+    """
+    def __init__(self, main_window, coalesce_ms=250):
+        self.main_window = main_window
+        self.coalesce_ms = coalesce_ms
+        self._pending = False
+        self._log_keys = {
+            ConfigFileChangeHandler._normalize(Logger.LOG_FILE()),
+            ConfigFileChangeHandler._normalize(Logger.DETAILED_LOG_FILE()),
+        }
+
+    def on_modified(self, event):
+        self._notify(event.src_path)
+
+    def on_created(self, event):
+        """Called when a rotated log is recreated."""
+        self._notify(event.src_path)
+
+    def on_moved(self, event):
+        self._notify(getattr(event, "dest_path", None))
+
+    def _notify(self, path):
+        if not path or self._pending:
+            return
+        if ConfigFileChangeHandler._normalize(path) not in self._log_keys:
+            return
+        # Set before scheduling so concurrent events from the observer thread
+        # queue at most one tail per coalesce window.
+        self._pending = True
+        self.main_window.root.after(self.coalesce_ms, self._flush)
+
+    def _flush(self):
+        self._pending = False
+        self.main_window.tail_log()
@@ -5,11 +5,21 @@ from dataclasses import dataclass
 from typing import Optional, List
 import sys
 import threading
+import platform
+
+# Built per platform, as ConfigManager does: expanduser() only expands "~" before
+# a "/" on Linux/Mac, so a Windows-style "~\AppData" path ended up relative to
+# the working directory when running from source there.
+_DEFAULT_LOG_DIRECTORY = (
+    os.path.join(os.path.expanduser("~"), "AppData", "Local", "VioletWing", "logs")
+    if platform.system() == "Windows"
+    else os.path.join(os.path.expanduser("~"), ".local", "share", "VioletWing", "logs")
+)
 
 @dataclass
 class LoggerConfig:
     """Configuration for the Logger class."""
-    log_directory: str = os.path.expanduser(r'~\AppData\Local\VioletWing\logs')
+    log_directory: str = _DEFAULT_LOG_DIRECTORY
     max_bytes: int = 5 * 1024 * 1024  # 5MB
     backup_count: int = 5
     clear_on_startup: bool = True
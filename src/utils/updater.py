@@ -57,9 +57,8 @@ class DownloadProgressModal:
 
     def _apply_icon(self) -> None:
         try:
-            from src.utils.utility import Utility
-            from src.gui.icon_loader import ASSETS_DIR
-            self._win.iconbitmap(Utility.resource_path(f"{ASSETS_DIR}/icon.ico"))
+            from src.gui.icon_loader import set_window_icon
+            set_window_icon(self._win)
         except Exception:
             pass
 
@@ -209,8 +208,7 @@ class DownloadProgressModal:
                         last_sample_time = now
                         last_sample_bytes = downloaded
 
-                    _d, _t, _s = downloaded, total_bytes, current_speed
-                    self._root.after(0, lambda d=_d, t=_t, s=_s: self._update_progress(d, t, s))
+                    self._root.after(0, self._update_progress, downloaded, total_bytes, current_speed)
 
             if self._cancel_event.is_set():
                 if temp_exe and os.path.exists(temp_exe):
@@ -292,11 +290,11 @@ class DownloadProgressModal:
                 env=proc_env,
             )
             logger.info("Updater process launched - pid %d", proc.pid)
-            self._root.after(0, lambda: self._finish(success=True, exc=None))
+            self._root.after(0, self._finish, True, None)
 
         except Exception as exc:
             Logger.error_code(EC.E4011, "%s", exc)
-            self._root.after(0, lambda e=exc: self._finish(success=False, exc=e))
+            self._root.after(0, self._finish, False, exc)
 
     def _finish(self, success: bool, exc: Exception | None) -> None:
         self._close()
@@ -351,22 +349,19 @@ class Updater:
         else:
             logger.warning("Could not retrieve release info from GitHub.")
 
-        self.main_window.root.after(0, lambda: on_complete(has_update, release))
+        self.main_window.root.after(0, on_complete, has_update, release)
 
     def changelog_already_seen(self) -> bool:
         """True if the user has already dismissed the changelog for this version."""
         if not self._latest_version:
             return True
-        config = ConfigManager.load_config()
-        return config.get("seen_changelog_version") == self._latest_version
+        return ConfigManager.get_value("seen_changelog_version") == self._latest_version
 
     def mark_changelog_seen(self) -> None:
         """Persist the current version tag so the changelog is not shown again."""
         if not self._latest_version:
             return
-        config = ConfigManager.load_config()
-        config["seen_changelog_version"] = self._latest_version
-        ConfigManager.save_config(config, log_info=False)
+        ConfigManager.set_value("seen_changelog_version", value=self._latest_version)
 
     def handle_update(self) -> None:
         from src.gui.modal import AppModal
@@ -2,7 +2,7 @@ import os
 import sys
 import requests
 
-from src.utils.config_manager import ConfigManager, COLOR_CHOICES
+from src.utils.config_manager import ConfigManager
 from src.utils.logger import Logger
 import src.utils.error_codes as EC
 
@@ -47,13 +47,6 @@ class Utility:
             Logger.error_code(EC.E0001, "%s", exc)
             return relative_path
 
-    @staticmethod
-    def get_color_name_from_hex(hex_color: str) -> str:
-        for name, code in COLOR_CHOICES.items():
-            if code == hex_color:
-                return name
-        return "Black"
-
     _TRANSLITERATE_TABLE = str.maketrans({
         'А': 'A',  'а': 'a',  'Б': 'B',  'б': 'b',  'В': 'V',  'в': 'v',
         'Г': 'G',  'г': 'g',  'Д': 'D',  'д': 'd',  'Е': 'E',  'е': 'e',
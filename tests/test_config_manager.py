@@ -0,0 +1,86 @@
+import math
+import tempfile
+import time
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from src.utils.config_manager import ConfigManager, _clone
+
+
+class CloneTests(unittest.TestCase):
+    def test_json_config_is_copied_deeply(self):
+        config = {"General": {"Trigger": True, "Keys": ["x", 1, 2.5, None]}}
+        cloned = _clone(config)
+        self.assertEqual(cloned, config)
+        self.assertIsNot(cloned["General"], config["General"])
+        self.assertIsNot(cloned["General"]["Keys"], config["General"]["Keys"])
+
+    def test_default_config_round_trips(self):
+        self.assertEqual(_clone(ConfigManager.DEFAULT_CONFIG), ConfigManager.DEFAULT_CONFIG)
+
+    def test_tuples_stay_tuples(self):
+        cloned = _clone({"color": (255, 0, 0)})
+        self.assertEqual(cloned["color"], (255, 0, 0))
+        self.assertIsInstance(cloned["color"], tuple)
+
+    def test_non_finite_floats_are_preserved(self):
+        cloned = _clone({"nan": float("nan"), "inf": float("inf")})
+        self.assertTrue(math.isnan(cloned["nan"]))
+        self.assertEqual(cloned["inf"], float("inf"))
+
+    def test_non_str_keys_are_copied(self):
+        self.assertEqual(_clone({1: "a", ("x", 2): "b"}), {1: "a", ("x", 2): "b"})
+
+    def test_large_ints_are_preserved(self):
+        self.assertEqual(_clone({"big": 2 ** 70}), {"big": 2 ** 70})
+
+    def test_dict_subclass_keeps_its_type(self):
+        cloned = _clone(OrderedDict(a=1))
+        self.assertIsInstance(cloned, OrderedDict)
+
+
+class BackgroundWriteTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config_file = Path(tmp.name) / "config.json"
+        for name, value in (
+            ("CONFIG_DIRECTORY", tmp.name),
+            ("CONFIG_FILE", self.config_file),
+            ("_config_cache", None),
+            ("_pending_write", None),
+            ("_last_saved_mtime_ns", None),
+        ):
+            patcher = mock.patch.object(ConfigManager, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _on_disk(self):
+        return orjson.loads(self.config_file.read_bytes())
+
+    def test_async_saves_keep_the_newest(self):
+        for v in range(20):
+            ConfigManager.save_config_async({"v": v})
+        self.assertTrue(ConfigManager.flush_writes())
+        self.assertEqual(self._on_disk(), {"v": 19})
+        self.assertTrue(ConfigManager.file_matches_last_save())
+
+    def test_sync_save_is_not_overwritten_by_an_older_queued_snapshot(self):
+        # Hold the write lock so the writer wakes for {"v": 1} but cannot write
+        # it; a synchronous save lands in that gap, as from another thread.
+        with ConfigManager._write_lock:
+            ConfigManager.save_config_async({"v": 1})
+            time.sleep(0.1)
+            ConfigManager.save_config({"v": 2}, log_info=False)
+        self.assertTrue(ConfigManager.flush_writes())
+        self.assertEqual(ConfigManager.load_config(), {"v": 2})
+        self.assertEqual(self._on_disk(), {"v": 2})
+        self.assertTrue(ConfigManager.file_matches_last_save())
+
+
+if __name__ == "__main__":
+    unittest.main()